@@ -1,5 +1,67 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import (
+    Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple,
+)
+
+# First field of a log line, e.g. "ERROR: Connection timeout"
+LOG_LEVELS = frozenset(
+    {"DEBUG", "INFO", "NOTICE", "WARN", "WARNING", "ERROR", "CRITICAL", "FATAL"}
+)
+
+# Text is scanned in slices of this many characters to bound temporary lists
+WORD_CHUNK = 1 << 16
+
+
+def count_words(text: str, chunk_size: int = WORD_CHUNK) -> int:
+    """Count whitespace-separated words, one bounded slice at a time."""
+    words = 0
+    in_word = False
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start:start + chunk_size]
+        words += len(chunk.split())
+        if in_word and not chunk[0].isspace():
+            # The previous slice ended mid-word; don't count it twice
+            words -= 1
+        in_word = not chunk[-1].isspace()
+    return words
+
+
+def iter_words(text: str, chunk_size: int = WORD_CHUNK) -> Iterator[str]:
+    """Yield whitespace-separated words, one bounded slice at a time."""
+    carry = ""
+    for start in range(0, len(text), chunk_size):
+        chunk = carry + text[start:start + chunk_size]
+        words = chunk.split()
+        carry = ""
+        if words and not chunk[-1].isspace():
+            carry = words.pop()
+        yield from words
+    if carry:
+        yield carry
+
+
+def _prune_terms(terms: Counter, max_terms: int) -> Counter:
+    """Keep only the ``max_terms`` most frequent terms."""
+    return Counter(dict(terms.most_common(max_terms)))
+
+
+def _corpus_chunk(
+    documents: List[str], term_frequencies: bool, max_terms: int
+) -> Tuple[List[Tuple[int, int]], Counter]:
+    """Worker: per-document (chars, words) and pruned term counts."""
+    counts = []
+    terms: Counter = Counter()
+    for document in documents:
+        counts.append((len(document), count_words(document)))
+        if term_frequencies:
+            terms.update(word.lower() for word in iter_words(document))
+            if len(terms) > 2 * max_terms:
+                terms = _prune_terms(terms, max_terms)
+    return counts, _prune_terms(terms, max_terms)
 
 
 class DataProcessor(ABC):
@@ -11,6 +73,10 @@ class DataProcessor(ABC):
     def validate(self, data: Any) -> bool:
         pass
 
+    def process_unchecked(self, data: Any) -> str:
+        """Process data the caller has already validated."""
+        return self.process(data)
+
     def format_output(self, result: str) -> str:
         return result
 
@@ -24,6 +90,9 @@ class NumericProcessor(DataProcessor):
         
         if self.validate(data) == False:
             return "Cannot Proccessing Data"
+        return self.process_unchecked(data)
+
+    def process_unchecked(self, data: Any) -> str:
         return (
             f"Processed {len(data)} numeric values, sum={sum(data)},"
             f" avg={sum(data) / len(data)}"
@@ -47,12 +116,75 @@ class TextProcessor(DataProcessor):
 
     def process(self, data: Any) -> str:
         if self.validate(data):
-            string = str(data)
-            words = string.split(" ")
-            return f"Processed text: {len(string)} characters, {len(words)} words"
+            return self.process_unchecked(data)
         else:
             return "Cannot Proccessing Data"
 
+    def process_unchecked(self, data: Any) -> str:
+        string = str(data)
+        return (
+            f"Processed text: {len(string)} characters, "
+            f"{count_words(string)} words"
+        )
+
+    def process_corpus(
+        self,
+        documents: Iterable[str],
+        workers: Optional[int] = None,
+        chunk_docs: int = 256,
+        term_frequencies: bool = False,
+        max_terms: int = 1000,
+    ) -> Dict[str, Any]:
+        """Count chars and words over many documents in parallel chunks.
+
+        Documents are sent to worker processes ``chunk_docs`` at a time.
+        ``workers=1`` stays in-process, as does input that fits in one
+        chunk, so small calls never start a pool. The result holds the
+        totals, the per-document ``(chars, words)`` pairs in input order
+        and, when ``term_frequencies`` is set, the ``max_terms`` most
+        frequent lower-cased terms. Term tables are pruned to the top terms
+        as they grow, so memory stays bounded; counts of terms near the
+        cut-off can therefore be underestimated.
+        """
+        per_document: List[Tuple[int, int]] = []
+        terms: Counter = Counter()
+
+        def merge(part: Tuple[List[Tuple[int, int]], Counter]) -> None:
+            nonlocal terms
+            per_document.extend(part[0])
+            terms.update(part[1])
+            if len(terms) > 2 * max_terms:
+                terms = _prune_terms(terms, max_terms)
+
+        items = iter(documents)
+        chunks = iter(lambda: list(islice(items, chunk_docs)), [])
+        head = list(islice(chunks, 2))
+        chunks = chain(head, chunks)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(head) < 2:
+            for chunk in chunks:
+                merge(_corpus_chunk(chunk, term_frequencies, max_terms))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                in_flight: Deque[Future] = deque()
+                for chunk in chunks:
+                    in_flight.append(pool.submit(
+                        _corpus_chunk, chunk, term_frequencies, max_terms
+                    ))
+                    if len(in_flight) >= 2 * workers:
+                        merge(in_flight.popleft().result())
+                while in_flight:
+                    merge(in_flight.popleft().result())
+
+        return {
+            "documents": len(per_document),
+            "chars": sum(chars for chars, _ in per_document),
+            "words": sum(words for _, words in per_document),
+            "per_document": per_document,
+            "terms": _prune_terms(terms, max_terms).most_common()
+            if term_frequencies else [],
+        }
+
     def validate(self, data: Any) -> bool:
         if isinstance(data, str):
             return True
@@ -67,63 +199,143 @@ class LogProcessor(DataProcessor):
 
     def process(self, data: Any) -> str:
         if self.validate(data):
-            string = str(data).split(":")
-            message = "ERROR"
-            if string[0] != "ERROR":
-                message = string[0]
-            return f"{[message]} {message} level detected:{string[-1]}"
+            return self.process_unchecked(data)
         else:
             return "Cannot Proccessing Data"
 
+    def process_unchecked(self, data: Any) -> str:
+        string = str(data).split(":")
+        message = "ERROR"
+        if string[0] != "ERROR":
+            message = string[0]
+        return f"{[message]} {message} level detected:{string[-1]}"
+
     def validate(self, data: Any) -> bool:
         if isinstance(data, str):  
             return True
         else:
             return False
 
+    @staticmethod
+    def looks_like_log(data: str) -> bool:
+        """True if ``data`` starts with a known level, e.g. ``"INFO:"``."""
+        level, sep, _ = data.partition(":")
+        return bool(sep) and level.strip() in LOG_LEVELS
+
+
+class ProcessorRegistry:
+    """Picks a processor for each input from its type and shape.
+
+    Processors are registered for one or more types, optionally with a
+    shape predicate that does the validation (e.g. "every item is an int",
+    "starts with a log level"). The first registration that accepts the
+    input wins, and its ``process_unchecked`` is called, so data is only
+    inspected once. The candidate list per concrete type is cached.
+    """
+
+    def __init__(self) -> None:
+        self.__entries: List[
+            Tuple[Tuple[type, ...], Optional[Callable[[Any], bool]], DataProcessor]
+        ] = []
+        self.__cache: Dict[
+            type, List[Tuple[Optional[Callable[[Any], bool]], DataProcessor]]
+        ] = {}
+
+    def register(
+        self,
+        processor: DataProcessor,
+        types: Tuple[type, ...],
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        self.__entries.append((types, predicate, processor))
+        self.__cache.clear()
+
+    def select(self, data: Any) -> Optional[DataProcessor]:
+        candidates = self.__cache.get(type(data))
+        if candidates is None:
+            candidates = [
+                (predicate, processor)
+                for types, predicate, processor in self.__entries
+                if issubclass(type(data), types)
+            ]
+            self.__cache[type(data)] = candidates
+        for predicate, processor in candidates:
+            if predicate is None or predicate(data):
+                return processor
+        return None
+
+    def process(self, data: Any) -> str:
+        processor = self.select(data)
+        if processor is None:
+            return "Cannot Proccessing Data"
+        return processor.process_unchecked(data)
+
+    def process_many(self, items: Iterable[Any]) -> List[str]:
+        return [self.process(data) for data in items]
+
+    @classmethod
+    def with_processors(
+        cls,
+        numeric: NumericProcessor,
+        text: TextProcessor,
+        log: LogProcessor,
+    ) -> "ProcessorRegistry":
+        """Registry routing int sequences, log lines and other text."""
+        registry = cls()
+        registry.register(numeric, (list, tuple), numeric.validate)
+        registry.register(log, (str,), LogProcessor.looks_like_log)
+        registry.register(text, (str,))
+        return registry
+
+
+def main() -> None:
+    """Run the data processor demo."""
+    print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===")
+    processor_numeric = NumericProcessor()
+    data = [1, 2, 3, 4, 5]
+    print("Processing data:", data)
+    pr = processor_numeric.process(data)
+    if processor_numeric.validate(data):
+        print("Validation: Numeric data verified")
+        print("Output:", processor_numeric.format_output(pr), "\n")
+    else:
+        print("Validation: Numeric data not verified")
+
+    processor_text = TextProcessor()
+    data = "Hello Nexus World"
+    print("Processing data:", data)
+    if processor_text.validate(data):
+        print("Validation: Text data verified")
+        print("Output:", processor_text.format_output(processor_text.process(data)), "\n")
+    else:
+        print("Validation: Text data not verified")
+
+    processor_log = LogProcessor()
+    data = "ERROR: Connection timeout"
+    print("Processing data:", data)
+    if processor_log.validate(data):
+        print("Validation: Log entry verified")
+        print("Output:", processor_log.format_output(processor_log.process(data)), "\n")
+    else:
+        print("Validation: Log entry not verified")
+
+
+    print("=== Polymorphic Processing Demo ===")
+    print("Processing multiple data types through same interface...")
+
+    tasks = [
+        (processor_numeric, [1, 2, 3]),
+        (processor_text, "Hello Nexus"),
+        (processor_log, "INFO: System ready"),
+    ]
+    print()
+    for i, (pr, data) in enumerate(tasks, 1):
+        result = pr.format_output(pr.process(data))
+        print(f"Result {i}: {result}")
+
+
+    print("\nFoundation systems online. Nexus ready for advanced streams.")
+
 
-print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===")
-processor_numeric = NumericProcessor()
-data = [1, 2, 3, 4, 5]
-print("Processing data:", data)
-pr = processor_numeric.process(data)
-if processor_numeric.validate(data):
-    print("Validation: Numeric data verified")
-    print("Output:", processor_numeric.format_output(pr), "\n")
-else:
-    print("Validation: Numeric data not verified")
-
-processor_text = TextProcessor()
-data = "Hello Nexus World"
-print("Processing data:", data)
-if processor_text.validate(data):
-    print("Validation: Text data verified")
-    print("Output:", processor_text.format_output(processor_text.process(data)), "\n")
-else:
-    print("Validation: Text data not verified")
-
-processor_log = LogProcessor()
-data = "ERROR: Connection timeout"
-print("Processing data:", data)
-if processor_log.validate(data):
-    print("Validation: Log entry verified")
-    print("Output:", processor_log.format_output(processor_log.process(data)), "\n")
-else:
-    print("Validation: Log entry not verified")
-
-
-print("=== Polymorphic Processing Demo ===")
-print("Processing multiple data types through same interface...")
-
-tasks = [
-    (processor_numeric, [1, 2, 3]),
-    (processor_text, "Hello Nexus"),
-    (processor_log, "INFO: System ready"),
-]
-print()
-for i, (pr, data) in enumerate(tasks, 1):
-    result = pr.format_output(pr.process(data))
-    print(f"Result {i}: {result}")
-
-
-print("\nFoundation systems online. Nexus ready for advanced streams.")
+if __name__ == "__main__":
+    main()
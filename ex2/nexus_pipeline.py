@@ -1,5 +1,31 @@
+import base64
+import csv
+import hashlib
+import io
+import json
+import math
+import re
+import sqlite3
+import sys
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any, List, Protocol, runtime_checkable
+from collections import deque
+from typing import (
+    Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Protocol,
+    Tuple, Union, runtime_checkable,
+)
+
+# A whole numeric token: digits inside identifiers ("SENSOR_001", "user-7")
+# or version-like strings ("1.2.3") are not readings
+_NUMBER = re.compile(
+    r"(?<![\w.+-])[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?!\.?\w)"
+)
+
+# Returned by a stage to drop the record without it counting as a failure.
+# process() reports a dropped record as None; process_batch() and
+# PipelineChain.stream() leave it out of their results.
+DROPPED = object()
 
 
 class ProcessingStage(Protocol):
@@ -12,8 +38,12 @@ class ProcessingStage(Protocol):
 class InputStage:
     """Stage for validating initial input."""
 
+    def __init__(self, verbose: bool = True) -> None:
+        self.verbose = verbose
+
     def process(self, data: Any) -> Any:
-        print(f"Input: {data}")
+        if self.verbose:
+            print(f"Input: {data}")
         if not data:
             raise ValueError("Empty data received")
         return data
@@ -22,6 +52,9 @@ class InputStage:
 class TransformStage:
     """Stage for transforming data structure."""
 
+    def __init__(self, verbose: bool = True) -> None:
+        self.verbose = verbose
+
     def process(self, data: Any) -> Any:
         # initil message
         msg = "Unknown transformation"
@@ -38,13 +71,255 @@ class TransformStage:
             raise ValueError("Invalid data format")
         else:
             msg = "Aggregated and filtered"
-        print(f"Transform: {msg}")
+        if self.verbose:
+            print(f"Transform: {msg}")
         return data
 
 
+class StreamAggregator:
+    """Running count/avg/min/max over numeric readings in O(1) memory.
+
+    A summary is emitted to ``on_summary`` every ``emit_every`` readings or
+    every ``emit_interval`` seconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        emit_every: int = 100,
+        emit_interval: float = 5.0,
+        on_summary: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.emit_every = emit_every
+        self.emit_interval = emit_interval
+        self.on_summary = on_summary
+        self.last_summary: Optional[Dict[str, Any]] = None
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self.__since_emit = 0
+        self.__last_emit = time.monotonic()
+
+    def feed(self, data: Any) -> int:
+        """Parse readings out of ``data`` and fold them in; return how many."""
+        if isinstance(data, bool):
+            return 0
+        if isinstance(data, (int, float)):
+            self.update(float(data))
+            return 1
+        if isinstance(data, str):
+            found = 0
+            for match in _NUMBER.finditer(data):
+                self.update(float(match.group()))
+                found += 1
+            return found
+        if isinstance(data, dict):
+            return self.feed(data.get("value"))
+        try:
+            return sum(self.feed(item) for item in data)
+        except TypeError:
+            return 0
+
+    def update(self, value: float) -> None:
+        if self.count == 0:
+            self.minimum = self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+        self.count += 1
+        self.total += value
+        self.__since_emit += 1
+        if self.__since_emit >= self.emit_every or (
+            time.monotonic() - self.__last_emit >= self.emit_interval
+        ):
+            self.emit()
+
+    def summary(self) -> Dict[str, Any]:
+        avg = self.total / self.count if self.count else 0.0
+        return {
+            "type": "stream",
+            "count": self.count,
+            "avg": avg,
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "count": self.count, "total": self.total,
+            "min": self.minimum, "max": self.maximum,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.count = state["count"]
+        self.total = state["total"]
+        self.minimum = state["min"]
+        self.maximum = state["max"]
+
+    def emit(self) -> Dict[str, Any]:
+        self.last_summary = self.summary()
+        self.__since_emit = 0
+        self.__last_emit = time.monotonic()
+        if self.on_summary is not None:
+            self.on_summary(self.last_summary)
+        return self.last_summary
+
+
+# The exercises are standalone scripts, so record_key and RotatingBloomFilter
+# are duplicated in ex1/data_stream.py; main.py checks that both copies agree.
+def record_key(record: Any, fields: Optional[Tuple[str, ...]]) -> Any:
+    """Identity of a record for dedup: the given fields, or the whole item."""
+    if fields is None or not hasattr(record, "get"):
+        return record
+    return tuple(record.get(field) for field in fields)
+
+
+class RotatingBloomFilter:
+    """Constant-memory "seen recently?" set for dropping replayed records.
+
+    Two Bloom filter generations are kept. New keys go into the current
+    one, and lookups check both. The current generation is rotated out
+    when it holds ``capacity`` keys or is ``rotate_seconds`` old, so a
+    duplicate is always caught within one rotation period and forgotten
+    after two. Each generation is sized for half of ``fp_rate``, which
+    bounds the chance that a new key is wrongly dropped. Memory is about
+    ``-2 * capacity * ln(fp_rate / 2) / ln(2) ** 2`` bits: roughly 400 KB
+    for the defaults.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        fp_rate: float = 0.001,
+        rotate_seconds: float = 300.0,
+    ) -> None:
+        if capacity < 1 or not 0 < fp_rate < 1:
+            raise ValueError("capacity must be positive and 0 < fp_rate < 1")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.rotate_seconds = rotate_seconds
+        bits = math.ceil(-capacity * math.log(fp_rate / 2) / math.log(2) ** 2)
+        self.__bits = bits
+        self.__hashes = max(1, round(bits / capacity * math.log(2)))
+        self.__current = bytearray((bits + 7) // 8)
+        self.__previous = bytearray(len(self.__current))
+        self.__count = 0
+        self.__rotated = time.monotonic()
+        self.duplicates = 0
+        self.rotations = 0
+
+    def __positions(self, key: Any) -> List[int]:
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.__bits for i in range(self.__hashes)]
+
+    @staticmethod
+    def __has(bits: bytearray, positions: List[int]) -> bool:
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def __contains__(self, key: Any) -> bool:
+        positions = self.__positions(key)
+        return self.__has(self.__current, positions) or self.__has(
+            self.__previous, positions
+        )
+
+    def add(self, key: Any) -> bool:
+        """Record ``key``; return False if it was (probably) seen already."""
+        if (
+            self.__count >= self.capacity
+            or time.monotonic() - self.__rotated >= self.rotate_seconds
+        ):
+            self.rotate()
+        positions = self.__positions(key)
+        if self.__has(self.__current, positions) or self.__has(
+            self.__previous, positions
+        ):
+            self.duplicates += 1
+            return False
+        for p in positions:
+            self.__current[p >> 3] |= 1 << (p & 7)
+        self.__count += 1
+        return True
+
+    def rotate(self) -> None:
+        self.__previous = self.__current
+        self.__current = bytearray(len(self.__previous))
+        self.__count = 0
+        self.__rotated = time.monotonic()
+        self.rotations += 1
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        return {
+            "duplicates": self.duplicates,
+            "rotations": self.rotations,
+            "memory_bytes": 2 * len(self.__current),
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        def pack(bits: bytearray) -> str:
+            return base64.b64encode(zlib.compress(bits)).decode()
+
+        return {
+            "current": pack(self.__current),
+            "previous": pack(self.__previous),
+            "count": self.__count,
+            "duplicates": self.duplicates,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        def unpack(blob: str) -> bytearray:
+            return bytearray(zlib.decompress(base64.b64decode(blob)))
+
+        current = unpack(state["current"])
+        if len(current) != len(self.__current):
+            raise ValueError("Checkpoint was saved with a different filter size")
+        self.__current = current
+        self.__previous = unpack(state["previous"])
+        self.__count = state["count"]
+        self.duplicates = state["duplicates"]
+        self.__rotated = time.monotonic()
+
+
+class DedupStage:
+    """Stage that drops records already seen recently, keyed on ``fields``."""
+
+    def __init__(
+        self,
+        fields: Optional[Tuple[str, ...]] = None,
+        capacity: int = 100_000,
+        fp_rate: float = 0.001,
+        rotate_seconds: float = 300.0,
+        verbose: bool = True,
+    ) -> None:
+        self.fields = fields
+        self.filter = RotatingBloomFilter(capacity, fp_rate, rotate_seconds)
+        self.verbose = verbose
+
+    def process(self, data: Any) -> Any:
+        if self.filter.add(record_key(data, self.fields)):
+            return data
+        if self.verbose:
+            print("Dedup: duplicate record dropped")
+        return DROPPED
+
+    def get_state(self) -> Dict[str, Any]:
+        return self.filter.get_state()
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.filter.set_state(state)
+
+
 class OutputStage:
     """Stage for generating final output summary."""
 
+    def __init__(
+        self, aggregator: Optional[StreamAggregator] = None, verbose: bool = True
+    ) -> None:
+        self.aggregator = aggregator
+        self.verbose = verbose
+
     def process(self, data: Any) -> str:
         output = ""
         if isinstance(data, dict):
@@ -52,28 +327,403 @@ class OutputStage:
                 output = f"Processed temperature reading: {data.get('value')}°C (Normal range)"
             elif data.get("type") == "csv":
                 output = f"User activity logged: {data.get('count')} actions processed"
+        elif self.aggregator is not None:
+            self.aggregator.feed(data)
+            stats = self.aggregator.summary()
+            output = f"Stream summary: {stats['count']} readings, avg: {stats['avg']:.1f}°C"
         else:
-            output = "Stream summary: 5 readings, avg: 22.1°C"
-        print(f"Output: {output}")
+            output = "Stream summary: no aggregator attached"
+        if self.verbose:
+            print(f"Output: {output}")
         return output
 
+    def get_state(self) -> Dict[str, Any]:
+        if self.aggregator is None:
+            return {}
+        return self.aggregator.get_state()
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        if self.aggregator is not None and state:
+            self.aggregator.set_state(state)
+
+
+class AnalyzeStage:
+    """Stage folding each record's value into a running aggregate.
+
+    Records are passed on with the running average attached as
+    ``running_avg``, so later stages still receive structured data.
+    """
+
+    def __init__(
+        self, aggregator: Optional[StreamAggregator] = None, verbose: bool = True
+    ) -> None:
+        self.aggregator = (
+            aggregator if aggregator is not None else StreamAggregator()
+        )
+        self.verbose = verbose
+
+    def process(self, data: Any) -> Any:
+        self.aggregator.feed(data)
+        if isinstance(data, dict):
+            data["running_avg"] = self.aggregator.summary()["avg"]
+        if self.verbose:
+            print(f"Analyze: {self.aggregator.count} readings so far")
+        return data
+
+    def get_state(self) -> Dict[str, Any]:
+        return self.aggregator.get_state()
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.aggregator.set_state(state)
+
+
+class BufferedSink(ABC):
+    """Terminal stage that buffers records and writes them in bulk.
+
+    The buffer is flushed when it holds ``max_records`` records or
+    ``max_bytes`` encoded bytes, or when ``max_seconds`` have passed since
+    the last flush (checked as records arrive). Call ``close`` to write
+    out the remainder. Records are passed through unchanged.
+    """
+
+    def __init__(
+        self,
+        max_records: int = 1000,
+        max_bytes: int = 1 << 20,
+        max_seconds: float = 1.0,
+    ) -> None:
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.flushes = 0
+        self.written = 0
+        self.__buffer: List[Any] = []
+        self.__bytes = 0
+        self.__last_flush = time.monotonic()
+
+    @abstractmethod
+    def encode(self, record: Any) -> Tuple[Any, int]:
+        """Return the buffered form of ``record`` and its size in bytes."""
+
+    @abstractmethod
+    def write_batch(self, items: List[Any]) -> None:
+        """Write a batch of encoded items in one operation."""
+
+    def process(self, data: Any) -> Any:
+        item, size = self.encode(data)
+        self.__buffer.append(item)
+        self.__bytes += size
+        if (
+            len(self.__buffer) >= self.max_records
+            or self.__bytes >= self.max_bytes
+            or time.monotonic() - self.__last_flush >= self.max_seconds
+        ):
+            self.flush()
+        return data
+
+    def flush(self) -> int:
+        count = len(self.__buffer)
+        if count:
+            self.write_batch(self.__buffer)
+            self.flushes += 1
+            self.written += count
+        self.__buffer = []
+        self.__bytes = 0
+        self.__last_flush = time.monotonic()
+        return count
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "BufferedSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class MemorySink(BufferedSink):
+    """Sink collecting records in memory, mainly for tests and demos."""
+
+    def __init__(self, max_records: int = 1000, max_bytes: int = 1 << 20,
+                 max_seconds: float = 1.0) -> None:
+        super().__init__(max_records, max_bytes, max_seconds)
+        self.records: List[Any] = []
+
+    def encode(self, record: Any) -> Tuple[Any, int]:
+        return record, sys.getsizeof(record)
+
+    def write_batch(self, items: List[Any]) -> None:
+        self.records.extend(items)
+
+
+class JSONLSink(BufferedSink):
+    """Sink appending one JSON document per line to a file."""
+
+    def __init__(self, path: str, max_records: int = 1000,
+                 max_bytes: int = 1 << 20, max_seconds: float = 1.0) -> None:
+        super().__init__(max_records, max_bytes, max_seconds)
+        self.file = open(path, "a", encoding="utf-8")
+
+    def encode(self, record: Any) -> Tuple[Any, int]:
+        line = json.dumps(record, default=str) + "\n"
+        return line, len(line)
+
+    def write_batch(self, items: List[Any]) -> None:
+        self.file.write("".join(items))
+        self.file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+
+class CSVSink(BufferedSink):
+    """Sink appending rows to a CSV file; non-dict records fill one column."""
+
+    def __init__(self, path: str, fieldnames: List[str],
+                 max_records: int = 1000, max_bytes: int = 1 << 20,
+                 max_seconds: float = 1.0) -> None:
+        super().__init__(max_records, max_bytes, max_seconds)
+        self.fieldnames = fieldnames
+        self.file = open(path, "a", encoding="utf-8", newline="")
+        self.__row = io.StringIO()
+        self.__writer = csv.writer(self.__row)
+        if self.file.tell() == 0:
+            self.__writer.writerow(fieldnames)
+            self.file.write(self.__take_row())
+
+    def __take_row(self) -> str:
+        row = self.__row.getvalue()
+        self.__row.seek(0)
+        self.__row.truncate()
+        return row
+
+    def encode(self, record: Any) -> Tuple[Any, int]:
+        if isinstance(record, dict):
+            self.__writer.writerow([record.get(name) for name in self.fieldnames])
+        else:
+            self.__writer.writerow([record])
+        row = self.__take_row()
+        return row, len(row)
+
+    def write_batch(self, items: List[Any]) -> None:
+        self.file.write("".join(items))
+        self.file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+
+class SQLiteSink(BufferedSink):
+    """Sink inserting rows into a local SQLite table, one transaction per batch.
+
+    With ``columns`` dict records are spread over those columns; otherwise
+    each record is stored as JSON in a single ``payload`` column.
+    """
+
+    def __init__(self, path: str, table: str = "records",
+                 columns: Optional[List[str]] = None, max_records: int = 1000,
+                 max_bytes: int = 1 << 20, max_seconds: float = 1.0) -> None:
+        super().__init__(max_records, max_bytes, max_seconds)
+        self.columns = columns
+        names = columns if columns is not None else ["payload"]
+        for name in [table, *names]:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid SQL identifier: {name}")
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(names)})"
+        )
+        self.__insert = (
+            f"INSERT INTO {table} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))})"
+        )
+
+    def encode(self, record: Any) -> Tuple[Any, int]:
+        if self.columns is None:
+            payload = json.dumps(record, default=str)
+            return (payload,), len(payload)
+        if isinstance(record, dict):
+            row = tuple(record.get(name) for name in self.columns)
+        else:
+            row = (record,) + (None,) * (len(self.columns) - 1)
+        return row, sum(len(str(value)) for value in row)
+
+    def write_batch(self, items: List[Any]) -> None:
+        with self.connection:
+            self.connection.executemany(self.__insert, items)
+
+    def close(self) -> None:
+        super().close()
+        self.connection.close()
+
+
+class StageError(Exception):
+    """Raised when a stage fails, carrying which stage it was and its input."""
+
+    def __init__(self, stage_index: int, stage: str, error: Exception,
+                 data: Any = None) -> None:
+        super().__init__(f"Stage {stage_index} ({stage}): {error}")
+        self.stage_index = stage_index
+        self.stage = stage
+        self.error = error
+        self.data = data
+
+
+class DeadLetter:
+    """A record that could not be processed, kept for later inspection.
+
+    ``pipeline_id`` names the pipeline whose stage failed last: the backup
+    pipeline when the record was rerouted and failed there too.
+    """
+
+    def __init__(self, pipeline_id: str, record: Any, failure: StageError,
+                 attempts: int) -> None:
+        self.pipeline_id = pipeline_id
+        self.record = record
+        self.stage_index = failure.stage_index
+        self.stage = failure.stage
+        self.error = failure.error
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return (
+            f"DeadLetter({self.pipeline_id}, stage={self.stage}, "
+            f"error={self.error!r}, record={self.record!r})"
+        )
+
 
 class ProcessingPipeline(ABC):
     """Abstract base class for processing pipelines."""
 
-    def __init__(self, pipeline_id: str):
+    def __init__(self, pipeline_id: str, max_dead_letters: int = 1000):
         self.pipeline_id = pipeline_id
         self.stages: List[ProcessingStage] = []
+        self.backup: Optional["ProcessingPipeline"] = None
+        self.dead_letters: Deque[DeadLetter] = deque(maxlen=max_dead_letters)
+        self.counters: Dict[str, int] = {
+            "processed": 0, "failed": 0, "retried": 0, "rerouted": 0,
+            "dropped": 0,
+        }
 
     def add_stage(self, stage: ProcessingStage) -> None:
         self.stages.append(stage)
 
+    def close(self) -> None:
+        """Flush and close any buffered sink stages."""
+        for stage in self.stages:
+            if isinstance(stage, BufferedSink):
+                stage.close()
+
+    def set_backup(self, pipeline: "ProcessingPipeline") -> None:
+        """Reroute records that keep failing here to ``pipeline``."""
+        self.backup = pipeline
+
     def stages_processor(self, data: Any) -> Any:
+        """Run ``data`` through every stage; None if a stage dropped it."""
         current = data
         for stage in self.stages:
             current = stage.process(current)
+            if current is DROPPED:
+                return None
         return current
 
+    def run_stages(self, data: Any, start: int = 1) -> Any:
+        """Like ``stages_processor``, but failures raise ``StageError``.
+
+        ``start`` is the 1-based stage to begin with, so a retry can resume
+        at the stage that failed instead of replaying the earlier ones.
+        """
+        current = data
+        for index, stage in enumerate(self.stages[start - 1:], start):
+            try:
+                current = stage.process(current)
+            except Exception as e:
+                raise StageError(index, type(stage).__name__, e, current) from e
+            if current is DROPPED:
+                break
+        return current
+
+    def process_batch(
+        self, records: Iterable[Any], retries: int = 0, backoff: float = 0.01
+    ) -> List[Any]:
+        """Process each record in isolation; failures never stop the batch.
+
+        A failing record is retried up to ``retries`` times with exponential
+        backoff, starting again at the stage that failed, so stateful stages
+        before it (e.g. dedup) see the record only once. It is then handed
+        to the backup pipeline if one is set, and finally recorded in
+        ``dead_letters``. Records a stage drops (e.g. duplicates) are
+        counted but left out of the results.
+        """
+        results = []
+        for record in records:
+            attempt = 0
+            pending, start = record, 1
+            while True:
+                try:
+                    result = self.run_stages(pending, start)
+                    if result is DROPPED:
+                        self.counters["dropped"] += 1
+                    else:
+                        results.append(result)
+                        self.counters["processed"] += 1
+                    break
+                except StageError as failure:
+                    if attempt < retries:
+                        time.sleep(backoff * (2 ** attempt))
+                        pending, start = failure.data, failure.stage_index
+                        attempt += 1
+                        self.counters["retried"] += 1
+                        continue
+                    # The pipeline whose stage produced ``failure``
+                    failed_in = self.pipeline_id
+                    if self.backup is not None:
+                        try:
+                            result = self.backup.run_stages(record)
+                            if result is not DROPPED:
+                                results.append(result)
+                            self.counters["rerouted"] += 1
+                            break
+                        except StageError as backup_failure:
+                            failure = backup_failure
+                            failed_in = self.backup.pipeline_id
+                    self.counters["failed"] += 1
+                    self.dead_letters.append(
+                        DeadLetter(failed_in, record, failure, attempt + 1)
+                    )
+                    break
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = dict(self.counters)
+        stats["dead_letters"] = len(self.dead_letters)
+        return stats
+
+    def __or__(self, other: "ProcessingPipeline") -> "PipelineChain":
+        """``a | b`` feeds the output of ``a`` straight into ``b``."""
+        return PipelineChain(self.members() + other.members())
+
+    def members(self) -> List["ProcessingPipeline"]:
+        """Pipelines this one is composed of (just itself unless a chain)."""
+        return [self]
+
+    def get_state(self) -> Dict[str, Any]:
+        """Checkpointable state: counters plus any stage aggregators."""
+        state: Dict[str, Any] = {"counters": dict(self.counters)}
+        for index, stage in enumerate(self.stages):
+            if hasattr(stage, "get_state"):
+                state[f"stage_{index}"] = stage.get_state()
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.counters.update(state["counters"])
+        for index, stage in enumerate(self.stages):
+            if f"stage_{index}" in state and hasattr(stage, "set_state"):
+                stage.set_state(state[f"stage_{index}"])
+
     @abstractmethod
     def process(self, data: Any) -> Any:
         pass
@@ -82,11 +732,11 @@ class ProcessingPipeline(ABC):
 class JSONAdapter(ProcessingPipeline):
     """Pipeline adapter for JSON data."""
 
-    def __init__(self, pipeline_id: str):
+    def __init__(self, pipeline_id: str, verbose: bool = True):
         super().__init__(pipeline_id)
-        self.add_stage(InputStage())
-        self.add_stage(TransformStage())
-        self.add_stage(OutputStage())
+        self.add_stage(InputStage(verbose))
+        self.add_stage(TransformStage(verbose))
+        self.add_stage(OutputStage(verbose=verbose))
 
     def process(self, data: Any) -> Any:
         return self.stages_processor(data)
@@ -95,11 +745,11 @@ class JSONAdapter(ProcessingPipeline):
 class CSVAdapter(ProcessingPipeline):
     """Pipeline adapter for CSV data."""
 
-    def __init__(self, pipeline_id: str):
+    def __init__(self, pipeline_id: str, verbose: bool = True):
         super().__init__(pipeline_id)
-        self.add_stage(InputStage())
-        self.add_stage(TransformStage())
-        self.add_stage(OutputStage())
+        self.add_stage(InputStage(verbose))
+        self.add_stage(TransformStage(verbose))
+        self.add_stage(OutputStage(verbose=verbose))
 
     def process(self, data: Any) -> Any:
         return self.stages_processor(data)
@@ -108,16 +758,210 @@ class CSVAdapter(ProcessingPipeline):
 class StreamAdapter(ProcessingPipeline):
     """Pipeline adapter for Stream data."""
 
-    def __init__(self, pipeline_id: str):
+    def __init__(
+        self,
+        pipeline_id: str,
+        aggregator: Optional[StreamAggregator] = None,
+        verbose: bool = True,
+    ):
+        super().__init__(pipeline_id)
+        self.aggregator = aggregator if aggregator is not None else StreamAggregator()
+        self.add_stage(InputStage(verbose))
+        self.add_stage(TransformStage(verbose))
+        self.add_stage(OutputStage(self.aggregator, verbose))
+
+    def process(self, data: Any) -> Any:
+        return self.stages_processor(data)
+
+
+class StagePipeline(ProcessingPipeline):
+    """Pipeline built from an explicit list of stages."""
+
+    def __init__(self, pipeline_id: str, stages: Iterable[ProcessingStage]):
         super().__init__(pipeline_id)
-        self.add_stage(InputStage())
-        self.add_stage(TransformStage())
-        self.add_stage(OutputStage())
+        for stage in stages:
+            self.add_stage(stage)
 
     def process(self, data: Any) -> Any:
         return self.stages_processor(data)
 
 
+class AdaptiveBatcher:
+    """Micro-batches records in front of a pipeline under a p99 latency target.
+
+    Records are buffered until ``max_batch`` have arrived or the oldest has
+    waited ``max_wait`` seconds, then run through ``process_batch``. Once
+    ``min_samples`` latencies (arrival to completion) have been collected,
+    their p99 is compared with ``p99_target``: a miss halves both limits, a
+    hit grows them by 10% (AIMD), so batches grow for throughput until
+    latency pushes back. Call ``poll`` periodically so a quiet feed still
+    flushes on time.
+    """
+
+    def __init__(
+        self,
+        pipeline: ProcessingPipeline,
+        p99_target: float = 0.05,
+        max_batch: int = 32,
+        max_wait: float = 0.005,
+        batch_bounds: Tuple[int, int] = (1, 10000),
+        wait_bounds: Tuple[float, float] = (0.0001, 1.0),
+        min_samples: int = 100,
+    ) -> None:
+        self.pipeline = pipeline
+        self.p99_target = p99_target
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batch_bounds = batch_bounds
+        self.wait_bounds = wait_bounds
+        self.min_samples = min_samples
+        self.batch_sizes: Deque[int] = deque(maxlen=64)
+        self.last_p99 = 0.0
+        self.__pending: List[Any] = []
+        self.__arrivals: List[float] = []
+        self.__latencies: List[float] = []
+        self.__batches = 0
+        self.__records = 0
+        self.__busy = 0.0
+
+    def submit(self, record: Any) -> List[Any]:
+        """Queue a record; returns pipeline results if this caused a flush."""
+        self.__pending.append(record)
+        self.__arrivals.append(time.monotonic())
+        if len(self.__pending) >= self.max_batch:
+            return self.flush()
+        return self.poll()
+
+    def poll(self) -> List[Any]:
+        """Flush if the oldest queued record has waited ``max_wait``."""
+        if self.__arrivals and (
+            time.monotonic() - self.__arrivals[0] >= self.max_wait
+        ):
+            return self.flush()
+        return []
+
+    def flush(self) -> List[Any]:
+        if not self.__pending:
+            return []
+        batch, arrivals = self.__pending, self.__arrivals
+        self.__pending, self.__arrivals = [], []
+        start = time.monotonic()
+        results = self.pipeline.process_batch(batch)
+        done = time.monotonic()
+        self.__busy += done - start
+        self.__batches += 1
+        self.__records += len(batch)
+        self.batch_sizes.append(len(batch))
+        self.__latencies.extend(done - arrived for arrived in arrivals)
+        if len(self.__latencies) >= self.min_samples:
+            self.__adjust()
+        return results
+
+    def __adjust(self) -> None:
+        latencies = sorted(self.__latencies)
+        self.__latencies = []
+        self.last_p99 = latencies[int(0.99 * (len(latencies) - 1))]
+        low_batch, high_batch = self.batch_bounds
+        low_wait, high_wait = self.wait_bounds
+        if self.last_p99 > self.p99_target:
+            self.max_batch = max(low_batch, self.max_batch // 2)
+            self.max_wait = max(low_wait, self.max_wait / 2)
+        else:
+            growth = max(1, self.max_batch // 10)
+            self.max_batch = min(high_batch, self.max_batch + growth)
+            self.max_wait = min(high_wait, self.max_wait * 1.1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        throughput = self.__records / self.__busy if self.__busy else 0.0
+        average = self.__records / self.__batches if self.__batches else 0.0
+        return {
+            "batches": self.__batches,
+            "records": self.__records,
+            "max_batch": self.max_batch,
+            "max_wait": self.max_wait,
+            "p99_latency": self.last_p99,
+            "avg_batch_size": average,
+            "recent_batch_sizes": list(self.batch_sizes),
+            "throughput": throughput,
+        }
+
+
+class PipelineChain(ProcessingPipeline):
+    """Several pipelines run back to back as one flattened stage list.
+
+    Each stage's output object is handed directly to the next stage, with
+    no copies or intermediate collections between pipelines. Input
+    validation has already happened at the head of the chain, so the
+    InputStage of every later pipeline is dropped. Records and time spent
+    are measured for every call.
+
+    Stage objects are shared with the member pipelines, not copied. A
+    chained StreamAdapter therefore feeds the same aggregator as the
+    standalone one, sinks and dedup filters are shared too, and closing
+    the chain closes the members' sinks. Chain pipelines whose output
+    feeds the next one's input: the adapters end in an OutputStage that
+    renders display text, so use StagePipeline for the inner links.
+    """
+
+    def __init__(self, pipelines: List[ProcessingPipeline],
+                 chain_id: Optional[str] = None):
+        super().__init__(
+            chain_id or " -> ".join(p.pipeline_id for p in pipelines)
+        )
+        self.pipelines = pipelines
+        for index, pipe in enumerate(pipelines):
+            for stage in pipe.stages:
+                if index > 0 and isinstance(stage, InputStage):
+                    continue
+                self.add_stage(stage)
+        self.records = 0
+        self.seconds = 0.0
+
+    def members(self) -> List[ProcessingPipeline]:
+        return list(self.pipelines)
+
+    def process(self, data: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.stages_processor(data)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.records += 1
+
+    def process_batch(
+        self, records: Iterable[Any], retries: int = 0, backoff: float = 0.01
+    ) -> List[Any]:
+        start = time.perf_counter()
+        counted = ("processed", "failed", "dropped", "rerouted")
+        before = sum(self.counters[key] for key in counted)
+        try:
+            return super().process_batch(records, retries, backoff)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.records += sum(self.counters[key] for key in counted) - before
+
+    def stream(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Lazily push records through the chain one at a time."""
+        stages = self.stages
+        for record in records:
+            start = time.perf_counter()
+            current = record
+            for stage in stages:
+                current = stage.process(current)
+                if current is DROPPED:
+                    break
+            self.seconds += time.perf_counter() - start
+            self.records += 1
+            if current is not DROPPED:
+                yield current
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = dict(super().get_stats())
+        stats["records"] = self.records
+        stats["seconds"] = self.seconds
+        return stats
+
+
 # passexisting codepass
 class NexusManager:
     def __init__(self):
@@ -127,21 +971,34 @@ class NexusManager:
     def add_pipeline(self, pipe: ProcessingPipeline):
         self.pipelines.append(pipe)
 
-    def process_data(self, data: Any):
-        target = None
+    def process_data(self, data: Any) -> Any:
+        # dicts are JSON records, strings CSV rows, anything else a stream
+        if isinstance(data, dict):
+            adapter = JSONAdapter
+        elif isinstance(data, str):
+            adapter = CSVAdapter
+        else:
+            adapter = StreamAdapter
+        format_type = adapter.__name__
 
+        target = None
         for pipe in self.pipelines:
-            if isinstance(pipe, JSONAdapter):
-                target = pipe
-            elif isinstance(pipe, CSVAdapter):
-                target = pipe
-            elif isinstance(pipe, StreamAdapter):
+            if isinstance(pipe, adapter):
                 target = pipe
+                break
 
         if target:
-            target.process(data)
+            return target.process(data)
         else:
             print(f"[ERROR] No suitable pipeline found for {format_type}")
+            return None
+
+    def chain(self, *pipelines: ProcessingPipeline) -> PipelineChain:
+        """Compose pipelines so each one's output feeds the next."""
+        members: List[ProcessingPipeline] = []
+        for pipe in pipelines:
+            members.extend(pipe.members())
+        return PipelineChain(members)
 
 
 def main():
@@ -178,24 +1035,51 @@ def main():
     manager.process_data("user,action,timestamp")
 
     print("\nProcessing Stream data through same pipeline...")
-    manager.process_data("Real-time sensor stream")
+    manager.process_data([22.1, 21.8, 22.5, 22.0, 22.1])
 
     print("\n=== Pipeline Chaining Demo ===")
-    print("Pipeline A -> Pipeline B -> Pipeline C")
+    analysis = StreamAggregator()
+    store = MemorySink()
+    chain = manager.chain(
+        StagePipeline("Pipeline A", [InputStage(False), TransformStage(False)]),
+        StagePipeline("Pipeline B", [AnalyzeStage(analysis, verbose=False)]),
+        StagePipeline("Pipeline C", [store]),
+    )
+    print(chain.pipeline_id)
 
     print("Data flow: Raw -> Processed -> Analyzed -> Stored")
-    print("Chain result: 100 records processed through 3-stage pipeline")
-    print("Performance: 95% efficiency, 0.2s total processing time")
+    readings = [{"sensor": "temp", "value": 20.0 + i % 5} for i in range(100)]
+    chain.process_batch(readings)
+    chain.close()
+    stats = chain.get_stats()
+    validated = sum(1 for r in store.records if r.get("status") == "valid")
+    print(
+        f"Chain result: {stats['records']} records processed through "
+        f"{len(chain.pipelines)}-stage pipeline "
+        f"({len(store.records)} stored, {validated} validated)"
+    )
+    summary = analysis.summary()
+    print(
+        f"Analysis: avg {summary['avg']:.1f}°C, "
+        f"range {summary['min']:.1f}-{summary['max']:.1f}°C"
+    )
+    print(
+        f"Performance: {stats['records'] / stats['seconds']:,.0f} records/s, "
+        f"{stats['seconds']:.4f}s total processing time"
+    )
 
     print("\n=== Error Recovery Test ===")
     print("Simulating pipeline failure...")
 
-    try:
-        p_json.process("INVALID_DATA")
-    except ValueError as e:
-        print(f"Error detected in Stage 2: {e}")
-        print("Recovery initiated: Switching to backup processor")
-        print("Recovery successful: Pipeline restored, processing resumed")
+    p_json.process_batch(["INVALID_DATA", {"sensor": "temp", "value": 21.0}])
+    for letter in p_json.dead_letters:
+        print(f"Error detected in Stage {letter.stage_index}: {letter.error}")
+    print("Recovery initiated: Failed record moved to dead-letter queue")
+    stats = p_json.get_stats()
+    print(
+        f"Recovery successful: Pipeline restored, processing resumed "
+        f"({stats['processed']} processed, {stats['failed']} failed)"
+    )
 
     print("\nNexus Integration complete. All systems operational.")
 
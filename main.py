@@ -10,8 +10,23 @@ Usage:
     python3 main.py [OPTIONS]
 
 Options:
-    -h, --help     Show this help message and exit
-    -v, --verbose  Enable verbose output with detailed test information
+    -h, --help      Show this help message and exit
+    -v, --verbose   Enable verbose output with detailed test information
+    -j, --parallel  Run the exercise suites in separate worker processes
+    --no-cache      Ignore and do not update the result cache
+    --perf          Also run the performance tier (scaling and memory checks)
+    --profile [FILE]
+                    Profile the run (or the given exercise script) and write
+                    nexus_profile.txt and nexus_profile.collapsed
+    --profile-memory [FILE]
+                    Like --profile, plus a second pass recording the peak
+                    allocation of each process/process_batch/filter_data call
+    --soak SECONDS  Drive the streams and pipelines with generated load for
+                    SECONDS and report throughput, latency and RSS
+    --typecheck [DIR]
+                    Only check type annotations of every .py file under DIR
+                    (default: current directory), with -j in parallel
+    --seed N        Seed for the --soak workload generator (default 0)
 
 Requirements:
     - Python 3.10 or later
@@ -32,14 +47,65 @@ Examples:
     python3 main.py              # Run all tests
     python3 main.py --help       # Show this help message
     python3 main.py --verbose    # Run with detailed output
+    python3 main.py --parallel   # Run exercise suites in parallel
+    python3 main.py --perf       # Add performance-conformance checks
+    python3 main.py --profile ex1/data_stream.py  # Profile one demo
+    python3 main.py --soak 600   # Ten-minute soak test
+    python3 main.py --typecheck ex1  # Annotation report for one directory
 """
 
 import sys
 import importlib.util
 import ast
-from typing import List, Dict, Any, Optional, Tuple  # noqa: F401
+import contextlib
+import csv
+import gc
+import hashlib
+import io
+import itertools
+import json
+import math
+import os
+import cProfile
+import pickle
+import pstats
+import random
+import runpy
+import signal
+import sqlite3
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Deque, Optional, Tuple  # noqa: F401
 from pathlib import Path
 
+CACHE_FILE = ".nexus_cache.json"
+PERF_SIZES = [2000, 4000, 8000, 16000]
+# Fitted exponents above these are reported as superlinear
+TIME_EXPONENT_LIMIT = 1.3
+MEMORY_EXPONENT_LIMIT = 1.3
+# Retained memory must stay under this at the largest size
+RETAINED_LIMIT = 256 * 1024
+PROFILE_PREFIX = "nexus_profile"
+# Methods whose peak allocations are recorded per call under --profile
+PROFILED_METHODS = {"process", "process_batch", "filter_data"}
+# Seconds between soak-test samples
+SOAK_INTERVAL = 5.0
+# Soak runs fail if RSS grows by more than this from the first sample
+SOAK_RSS_GROWTH_LIMIT = 32 * 1024 * 1024
+# Soak runs fail if the last interval's throughput falls below this
+# fraction of the first interval's
+SOAK_THROUGHPUT_FLOOR = 0.5
+
+
+def file_digest(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
 
 class TestResult:
     """Encapsulates test results with detailed feedback."""
@@ -62,6 +128,896 @@ class TestResult:
         """Mark test as passed."""
         self.passed = True
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result for caching or returning from a worker."""
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "TestResult":
+        """Rebuild a result produced by to_dict."""
+        result = TestResult(data["name"])
+        result.passed = data["passed"]
+        result.errors = list(data["errors"])
+        result.warnings = list(data["warnings"])
+        return result
+
+
+class PerfResult:
+    """Empirical scaling measurements for one class under --perf."""
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.sizes: List[int] = []
+        self.seconds: List[float] = []
+        self.peak_bytes: List[int] = []
+        self.retained_bytes: List[int] = []
+        self.time_exponent: float = 0.0
+        self.memory_exponent: float = 0.0
+        self.flags: List[str] = []
+        self.notes: List[str] = []
+
+    @property
+    def passed(self) -> bool:
+        """True when no scaling problems were flagged."""
+        return not self.flags
+
+
+def fit_exponent(sizes: List[int], values: List[float]) -> float:
+    """Least-squares slope of log(value) against log(size)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0
+    return sum(
+        (x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)
+    ) / spread
+
+
+# A perf case maps an input size to a ready-to-run workload
+PerfCase = Tuple[str, Callable[[int], Callable[[], Any]]]
+
+
+class PerfTester:
+    """Runs exercise classes on growing synthetic inputs and fits their cost."""
+
+    def __init__(self, sizes: Optional[List[int]] = None,
+                 repeats: int = 5) -> None:
+        self.sizes = sizes or PERF_SIZES
+        self.repeats = repeats
+
+    def build_cases(self, modules: Dict[str, Any],
+                    workdir: str) -> List[PerfCase]:
+        """Create the perf cases for whichever modules loaded."""
+        cases: List[PerfCase] = []
+        ex0 = modules.get("stream_processor")
+        ex1 = modules.get("data_stream")
+        ex2 = modules.get("nexus_pipeline")
+
+        if ex0 is not None:
+            def numeric(n: int) -> Callable[[], Any]:
+                """Sum and average n integers."""
+                processor = ex0.NumericProcessor()
+                data = list(range(n))
+                return lambda: processor.process(data)
+            cases.append(("NumericProcessor.process", numeric))
+
+        if ex1 is not None:
+            kinds = ["temp", "humidity", "pressure"]
+            sensor_data = [
+                {"type": kinds[i % 3], "value": 20.0 + i % 7}
+                for i in range(max(self.sizes))
+            ]
+            trans_data = [
+                {"action": "buy" if i % 2 else "sell", "amount": i % 100}
+                for i in range(max(self.sizes))
+            ]
+            event_data = [
+                "connection_error" if i % 5 == 0 else "user_login"
+                for i in range(max(self.sizes))
+            ]
+
+            def sensor(n: int) -> Callable[[], Any]:
+                """Process n sensor readings in one batch."""
+                stream = ex1.SensorStream("PERF_SENSOR")
+                batch = sensor_data[:n]
+                return lambda: stream.process_batch(batch)
+
+            def transaction(n: int) -> Callable[[], Any]:
+                """Process n transactions in one batch."""
+                stream = ex1.TransactionStream("PERF_TRANS")
+                batch = trans_data[:n]
+                return lambda: stream.process_batch(batch)
+
+            def event(n: int) -> Callable[[], Any]:
+                """Process n events in one batch."""
+                stream = ex1.EventStream("PERF_EVENT")
+                batch = event_data[:n]
+                return lambda: stream.process_batch(batch)
+
+            def checkpoint(n: int) -> Callable[[], Any]:
+                """Process n readings in batches of 100, checkpointing each."""
+                stream = ex1.SensorStream("PERF_CKPT")
+                batches = [
+                    sensor_data[i:i + 100] for i in range(0, n, 100)
+                ]
+                path = Path(workdir) / f"ckpt_{n}.bin"
+                path.unlink(missing_ok=True)
+                checkpointer = ex1.Checkpointer(str(path), every_batches=1)
+                processor = ex1.StreamProcessor()
+                return lambda: (
+                    processor.process_source(stream, batches, checkpointer),
+                    checkpointer,
+                )[1]
+
+            cases.extend([
+                ("SensorStream.process_batch", sensor),
+                ("TransactionStream.process_batch", transaction),
+                ("EventStream.process_batch", event),
+                ("Checkpointer.save (every 100 readings)", checkpoint),
+            ])
+
+        if ex2 is not None:
+            def adapter(cls: Any, make: Callable[[int], Any]
+                        ) -> Callable[[int], Callable[[], Any]]:
+                """Build a case pushing n records through an adapter."""
+                def prepare(n: int) -> Callable[[], Any]:
+                    """Create the adapter and its n records."""
+                    pipeline = cls("PERF", verbose=False)
+                    records = [make(i) for i in range(n)]
+                    return lambda: pipeline.process_batch(records)
+                return prepare
+
+            cases.extend([
+                ("JSONAdapter.process_batch", adapter(
+                    ex2.JSONAdapter,
+                    lambda i: {"sensor": "temp", "value": 20.0 + i % 5},
+                )),
+                ("CSVAdapter.process_batch", adapter(
+                    ex2.CSVAdapter, lambda i: f"user{i},login,{i}"
+                )),
+                ("StreamAdapter.process_batch", adapter(
+                    ex2.StreamAdapter, lambda i: 20.0 + i % 5
+                )),
+            ])
+        return cases
+
+    def measure_records(self, ex1: Any, count: int = 20000) -> PerfResult:
+        """Compare per-record memory of compact records against dicts."""
+        result = PerfResult("Record memory (slots vs dict)")
+        kinds = ["temp", "humidity", "pressure"]
+        actions = ["buy", "sell"]
+        builders: List[Tuple[str, Callable[[int], Any]]] = [
+            ("sensor dict",
+             lambda i: {"type": kinds[i % 3], "value": i * 0.5}),
+            ("SensorReading",
+             lambda i: ex1.SensorReading(kinds[i % 3], i * 0.5)),
+            ("transaction dict",
+             lambda i: {"action": actions[i % 2], "amount": i}),
+            ("Transaction",
+             lambda i: ex1.Transaction(actions[i % 2], i)),
+        ]
+        per_record: Dict[str, float] = {}
+        for label, build in builders:
+            gc.collect()
+            was_tracing = tracemalloc.is_tracing()
+            if not was_tracing:
+                tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            records = [build(i) for i in range(count)]
+            after = tracemalloc.get_traced_memory()[0]
+            if not was_tracing:
+                tracemalloc.stop()
+            # The list itself and the float/int values are common to both
+            per_record[label] = (after - before) / count
+            del records
+        for compact, plain in (("SensorReading", "sensor dict"),
+                               ("Transaction", "transaction dict")):
+            saving = 100 * (1 - per_record[compact] / per_record[plain])
+            result.notes.append(
+                f"{compact} {per_record[compact]:.0f} B vs dict "
+                f"{per_record[plain]:.0f} B ({saving:.0f}% smaller)"
+            )
+            if per_record[compact] >= per_record[plain]:
+                result.flags.append(f"{compact} is not smaller than a dict")
+        return result
+
+    def measure(self, name: str,
+                prepare: Callable[[int], Callable[[], Any]]) -> PerfResult:
+        """Time and trace one case across all sizes and fit its growth."""
+        result = PerfResult(name)
+        sink = io.StringIO()
+        last: Any = None
+        for size in self.sizes:
+            best = float("inf")
+            for _ in range(self.repeats):
+                with contextlib.redirect_stdout(sink):
+                    run = prepare(size)
+                    # Like timeit, keep collector pauses out of the timing
+                    gc.collect()
+                    gc.disable()
+                    try:
+                        start = time.perf_counter()
+                        last = run()
+                        best = min(best, time.perf_counter() - start)
+                    finally:
+                        gc.enable()
+            with contextlib.redirect_stdout(sink):
+                run = prepare(size)
+                gc.collect()
+                # Share tracing with --profile rather than stopping it
+                was_tracing = tracemalloc.is_tracing()
+                if was_tracing:
+                    tracemalloc.reset_peak()
+                else:
+                    tracemalloc.start()
+                before = tracemalloc.get_traced_memory()[0]
+                run()
+                current, peak = tracemalloc.get_traced_memory()
+                if not was_tracing:
+                    tracemalloc.stop()
+            sink.seek(0)
+            sink.truncate()
+            result.sizes.append(size)
+            result.seconds.append(best)
+            result.peak_bytes.append(peak - before)
+            result.retained_bytes.append(max(current - before, 0))
+
+        result.time_exponent = fit_exponent(result.sizes, result.seconds)
+        result.memory_exponent = fit_exponent(
+            result.sizes, [float(b) for b in result.peak_bytes]
+        )
+        if result.time_exponent > TIME_EXPONENT_LIMIT:
+            result.flags.append(
+                f"superlinear time: ~n^{result.time_exponent:.2f}"
+            )
+        if result.memory_exponent > MEMORY_EXPONENT_LIMIT:
+            result.flags.append(
+                f"superlinear peak memory: ~n^{result.memory_exponent:.2f}"
+            )
+        if result.retained_bytes[-1] > RETAINED_LIMIT:
+            result.flags.append(
+                f"retains {result.retained_bytes[-1] / 1024:.0f} KiB after "
+                f"{result.sizes[-1]} records"
+            )
+        if hasattr(last, "get_stats") and "avg_save_seconds" in last.get_stats():
+            stats = last.get_stats()
+            result.notes.append(
+                f"{stats['avg_save_seconds'] * 1e3:.3f} ms/save, "
+                f"{stats['last_size_bytes']} B/checkpoint"
+            )
+        return result
+
+    def run(self, modules: Dict[str, Any]) -> List[PerfResult]:
+        """Measure every case, printing one line per case."""
+        results = []
+        with tempfile.TemporaryDirectory() as workdir:
+            for name, prepare in self.build_cases(modules, workdir):
+                try:
+                    result = self.measure(name, prepare)
+                except Exception as e:
+                    result = PerfResult(name)
+                    result.flags.append(f"error while measuring: {e}")
+                results.append(result)
+                self._print(result)
+        if hasattr(modules.get("data_stream"), "SensorReading"):
+            results.append(self.measure_records(modules["data_stream"]))
+            self._print(results[-1])
+        return results
+
+    def _print(self, result: PerfResult) -> None:
+        """Print the one-line status of a result."""
+        mark = "✓" if result.passed else "✗"
+        print(f"{mark} {result.name}: {self.describe(result)}")
+
+    @staticmethod
+    def describe(result: PerfResult) -> str:
+        """One-line summary of a perf result."""
+        if not result.sizes:
+            return "; ".join(result.notes + result.flags)
+        text = (
+            f"time ~n^{result.time_exponent:.2f}, "
+            f"{result.seconds[-1] * 1e3:.2f} ms @ n={result.sizes[-1]}, "
+            f"peak {result.peak_bytes[-1] / 1024:.0f} KiB"
+        )
+        for note in result.notes:
+            text += f", {note}"
+        return text
+
+
+def current_rss() -> int:
+    """Resident set size in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class WorkloadGenerator:
+    """Deterministic synthetic feeds for the exercises' streams and pipelines.
+
+    Everything is drawn from one seeded ``random.Random``, so a seed always
+    reproduces the same records. Keys (sensor IDs, accounts, users) follow a
+    Zipf-like distribution over ``keys`` values: ``skew=0`` is uniform and
+    larger values concentrate traffic on a few hot keys. Each record is
+    malformed with probability ``error_rate``.
+    """
+
+    KINDS = ("sensor", "transaction", "log", "csv", "json", "stream")
+    LEVELS = ("INFO", "INFO", "INFO", "WARNING", "ERROR")
+    EVENTS = ("user_login", "user_logout", "connection_error", "page_view")
+
+    def __init__(self, seed: int = 0, skew: float = 1.0,
+                 error_rate: float = 0.001, keys: int = 1000) -> None:
+        self.seed = seed
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.keys = list(range(keys))
+        self.cum_weights = list(itertools.accumulate(
+            1 / rank ** skew for rank in range(1, keys + 1)
+        ))
+        self.sequence = 0
+
+    def _key(self) -> int:
+        return self.random.choices(self.keys, cum_weights=self.cum_weights)[0]
+
+    def _broken(self) -> bool:
+        return self.random.random() < self.error_rate
+
+    def sensor(self) -> Dict[str, Any]:
+        """A reading for SensorStream; broken ones carry no value."""
+        self.sequence += 1
+        if self._broken():
+            return {"type": "temp", "value": None}
+        return {
+            "sensor_id": f"sensor-{self._key()}",
+            "type": self.random.choice(("temp", "temp", "humidity", "pressure")),
+            "value": round(self.random.gauss(22.0, 1.5), 2),
+        }
+
+    def transaction(self) -> Dict[str, Any]:
+        """A transaction for TransactionStream; broken ones lack an amount."""
+        self.sequence += 1
+        action = self.random.choice(("buy", "sell"))
+        if self._broken():
+            return {"id": self.sequence, "action": action}
+        return {
+            "id": self.sequence,
+            "account": f"acct-{self._key()}",
+            "action": action,
+            "amount": self.random.randint(1, 500),
+        }
+
+    def log(self) -> str:
+        """A log line such as ``"ERROR: connection_error user-7"``."""
+        self.sequence += 1
+        if self._broken():
+            return ""
+        level = self.random.choice(self.LEVELS)
+        event = self.random.choice(self.EVENTS)
+        return f"{level}: {event} user-{self._key()}"
+
+    def csv(self) -> str:
+        """A ``user,action,timestamp`` row for CSVAdapter."""
+        self.sequence += 1
+        if self._broken():
+            return "INVALID_DATA"
+        action = self.random.choice(("login", "logout", "view"))
+        return f"user-{self._key()},{action},{1_700_000_000 + self.sequence}"
+
+    def json(self) -> str:
+        """A JSON sensor payload for JSONAdapter; broken ones don't parse."""
+        self.sequence += 1
+        if self._broken():
+            return '{"sensor": "temp", "value": '
+        return json.dumps({
+            "sensor": "temp",
+            "id": f"sensor-{self._key()}",
+            "value": round(self.random.gauss(22.0, 1.5), 2),
+        })
+
+    def stream(self) -> List[float]:
+        """A window of readings for StreamAdapter; broken ones are empty."""
+        self.sequence += 1
+        if self._broken():
+            return []
+        return [round(self.random.gauss(22.0, 1.5), 2) for _ in range(5)]
+
+    def batch(self, kind: str, size: int) -> List[Any]:
+        """``size`` records of one of ``KINDS``."""
+        make = getattr(self, kind)
+        return [make() for _ in range(size)]
+
+
+class SoakRunner:
+    """Drives StreamProcessor and NexusManager with generated load.
+
+    Workloads take turns, one batch at a time, for ``duration`` seconds;
+    ``rate`` caps the total records per second (0 runs flat out). Every
+    ``interval`` seconds a sample records throughput, batch latency
+    percentiles and RSS, so slow leaks and throughput decay show up as
+    trends. The run stops after ``duration`` seconds, so the last sample
+    may cover a shorter window; drift is judged on full-length samples.
+
+    NexusManager workloads process record by record and count failed
+    records. Streams take whole batches, so a malformed record fails its
+    batch; those are reported as failed batches. Failures don't count
+    toward latency.
+    """
+
+    def __init__(self, modules: Dict[str, Any], duration: float,
+                 generator: Optional[WorkloadGenerator] = None,
+                 batch_size: int = 100, rate: float = 0.0,
+                 interval: float = SOAK_INTERVAL) -> None:
+        self.modules = modules
+        self.duration = duration
+        self.generator = generator or WorkloadGenerator()
+        self.batch_size = batch_size
+        self.rate = rate
+        self.interval = interval
+        self.samples: List[Dict[str, float]] = []
+
+    def build_workloads(self) -> List[Tuple[str, str, Callable[[List[Any]], int]]]:
+        """(name, generator kind, run batch -> failed records) per workload."""
+        workloads: List[Tuple[str, str, Callable[[List[Any]], int]]] = []
+        ex1 = self.modules.get("data_stream")
+        ex2 = self.modules.get("nexus_pipeline")
+
+        if ex1 is not None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                processor = ex1.StreamProcessor()
+                streams = [
+                    ("SensorStream", "sensor", ex1.SensorStream("SOAK_SENSOR")),
+                    ("TransactionStream", "transaction",
+                     ex1.TransactionStream("SOAK_TRANS")),
+                    ("EventStream", "log", ex1.EventStream("SOAK_EVENT")),
+                ]
+
+            def via_processor(stream: Any) -> Callable[[List[Any]], int]:
+                """Run a whole batch through StreamProcessor.process_all."""
+                def run(batch: List[Any]) -> int:
+                    processor.process_all([(stream, batch)])
+                    return 0
+                return run
+
+            for name, kind, stream in streams:
+                workloads.append((name, kind, via_processor(stream)))
+
+        if ex2 is not None:
+            manager = ex2.NexusManager()
+            for adapter in (ex2.JSONAdapter, ex2.CSVAdapter, ex2.StreamAdapter):
+                manager.add_pipeline(adapter(f"SOAK_{adapter.__name__}",
+                                             verbose=False))
+
+            def via_manager(decode: Callable[[Any], Any]
+                            ) -> Callable[[List[Any]], int]:
+                """Route each record through NexusManager.process_data."""
+                def run(batch: List[Any]) -> int:
+                    failed = 0
+                    for record in batch:
+                        try:
+                            manager.process_data(decode(record))
+                        except Exception:
+                            failed += 1
+                    return failed
+                return run
+
+            # NexusManager routes each format to its own adapter
+            workloads.append(
+                ("Nexus/JSONAdapter", "json", via_manager(json.loads))
+            )
+            workloads.append(
+                ("Nexus/CSVAdapter", "csv", via_manager(lambda record: record))
+            )
+            workloads.append(
+                ("Nexus/StreamAdapter", "stream",
+                 via_manager(lambda record: record))
+            )
+        return workloads
+
+    def run(self) -> bool:
+        """Run the soak, print samples and a summary; False on degradation."""
+        workloads = self.build_workloads()
+        if not workloads:
+            print("❌ No exercise modules could be loaded")
+            return False
+        records: Counter = Counter()
+        errors: Counter = Counter()
+        failed_batches: Counter = Counter()
+        # Bounded per-workload history for the final percentiles
+        history: Dict[str, Deque[float]] = {
+            name: deque(maxlen=100_000) for name, _, _ in workloads
+        }
+        window: List[float] = []
+        window_records = 0
+        total_records = 0
+
+        start = window_start = time.monotonic()
+        for name, kind, run in itertools.cycle(workloads):
+            now = time.monotonic()
+            finished = now - start >= self.duration
+            if finished or now - window_start >= self.interval:
+                self._sample(now - start, now - window_start, window_records,
+                             window, sum(errors.values()),
+                             sum(failed_batches.values()))
+                window, window_records, window_start = [], 0, now
+                if finished:
+                    break
+            batch = self.generator.batch(kind, self.batch_size)
+            began = time.perf_counter()
+            try:
+                failed = run(batch)
+            except Exception:
+                failed_batches[name] += 1
+                failed = len(batch)
+            else:
+                errors[name] += failed
+            elapsed = time.perf_counter() - began
+            records[name] += len(batch)
+            if failed < len(batch):
+                window.append(elapsed)
+                history[name].append(elapsed)
+            window_records += len(batch)
+            total_records += len(batch)
+            if self.rate > 0:
+                now = time.monotonic() - start
+                ahead = total_records / self.rate - now
+                if ahead > 0:
+                    time.sleep(min(ahead, max(self.duration - now, 0.0)))
+
+        return self._summarize(time.monotonic() - start, records, errors,
+                               failed_batches, history)
+
+    def _sample(self, at: float, span: float, count: int,
+                window: List[float], errors: int, failed_batches: int) -> None:
+        """Record and print the measurements of one window."""
+        throughput = count / span if span > 0 else 0.0
+        sample = {
+            "t": at,
+            "span": span,
+            "throughput": throughput,
+            "p50": percentile(window, 50),
+            "p95": percentile(window, 95),
+            "p99": percentile(window, 99),
+            "rss": float(current_rss()),
+        }
+        self.samples.append(sample)
+        print(
+            f"  t={at:6.1f}s  {throughput:10,.0f} rec/s  "
+            f"p50 {sample['p50'] * 1e3:6.2f} ms  "
+            f"p95 {sample['p95'] * 1e3:6.2f} ms  "
+            f"p99 {sample['p99'] * 1e3:6.2f} ms  "
+            f"RSS {sample['rss'] / 2 ** 20:6.1f} MiB  "
+            f"errors {errors}  failed batches {failed_batches}"
+        )
+
+    def _summarize(self, elapsed: float, records: Counter, errors: Counter,
+                   failed_batches: Counter,
+                   history: Dict[str, Deque[float]]) -> bool:
+        """Print totals per workload and flag memory or throughput drift."""
+        total = sum(records.values())
+        print(f"\nSustained throughput: {total / elapsed:,.0f} records/s "
+              f"({total:,} records in {elapsed:.1f}s)")
+        for name, latencies in history.items():
+            values = list(latencies)
+            print(
+                f"  {name:<20} {records[name]:>10,} records "
+                f"{errors[name]:>6,} errors "
+                f"{failed_batches[name]:>6,} failed batches  "
+                f"p50 {percentile(values, 50) * 1e3:.2f} ms  "
+                f"p99 {percentile(values, 99) * 1e3:.2f} ms per batch"
+            )
+
+        flags = []
+        if len(self.samples) >= 2:
+            first, last = self.samples[0], self.samples[-1]
+            growth = last["rss"] - first["rss"]
+            print(f"RSS: {first['rss'] / 2 ** 20:.1f} MiB -> "
+                  f"{last['rss'] / 2 ** 20:.1f} MiB")
+            if growth > SOAK_RSS_GROWTH_LIMIT:
+                flags.append(f"RSS grew by {growth / 2 ** 20:.1f} MiB")
+        # A short final window gives a noisy rate; compare full windows
+        full = [sample for sample in self.samples
+                if sample["span"] >= self.interval / 2]
+        if len(full) >= 2:
+            first, last = full[0], full[-1]
+            if last["throughput"] < SOAK_THROUGHPUT_FLOOR * first["throughput"]:
+                flags.append(
+                    f"throughput fell from {first['throughput']:,.0f} to "
+                    f"{last['throughput']:,.0f} records/s"
+                )
+        for flag in flags:
+            print(f"✗ {flag}")
+        if not flags:
+            print("✓ No memory growth or throughput degradation detected")
+        return not flags
+
+
+class Profiler:
+    """Profiles a run with cProfile, a sampling timer and tracemalloc.
+
+    cProfile gives exact call counts and times. A SIGPROF interval timer
+    samples the Python stack every ``interval`` seconds of CPU time for a
+    flamegraph-compatible collapsed-stack file. With ``track_allocations``
+    the run is repeated (output suppressed) under a trace hook that records
+    the tracemalloc peak of each call of PROFILED_METHODS, nested calls
+    included. That hook fires on every stage of every record, so it gets
+    its own pass rather than skewing the timings.
+    """
+
+    def __init__(self, prefix: str = PROFILE_PREFIX,
+                 interval: float = 0.001,
+                 track_allocations: bool = False) -> None:
+        self.prefix = prefix
+        self.interval = interval
+        self.track_allocations = track_allocations
+        self.profile = cProfile.Profile()
+        self.samples: Counter = Counter()
+        # qualified name -> [calls, largest peak, summed peaks]
+        self.allocations: Dict[str, List[int]] = {}
+        self._frames: List[List[int]] = []
+
+    def _sample(self, signum: int, frame: Any) -> None:
+        """Signal handler recording the interrupted stack."""
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(
+                f"{code.co_name} ({Path(code.co_filename).name}:"
+                f"{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        self.samples[";".join(reversed(stack))] += 1
+
+    def _trace(self, frame: Any, event: str, arg: Any) -> Any:
+        """Global trace hook; only tracked methods get a local tracer."""
+        if frame.f_code.co_name not in PROFILED_METHODS:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            parent = self._frames[-1]
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+        self._frames.append([current, current])
+        frame.f_trace_lines = False
+        return self._trace_return
+
+    def _trace_return(self, frame: Any, event: str, arg: Any) -> Any:
+        """Local tracer closing the allocation window of a tracked call."""
+        if event != "return" or not self._frames:
+            return self._trace_return
+        start, highest = self._frames.pop()
+        highest = max(highest, tracemalloc.get_traced_memory()[1])
+        if self._frames:
+            parent = self._frames[-1]
+            parent[1] = max(parent[1], highest)
+        code = frame.f_code
+        name = getattr(code, "co_qualname", code.co_name)
+        stats = self.allocations.setdefault(name, [0, 0, 0])
+        stats[0] += 1
+        stats[1] = max(stats[1], highest - start)
+        stats[2] += highest - start
+        return None
+
+    def start(self) -> None:
+        """Begin collecting timings."""
+        if hasattr(signal, "setitimer"):
+            signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self.profile.enable()
+
+    def stop(self) -> None:
+        """Stop collecting timings."""
+        self.profile.disable()
+        if hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def start_allocations(self) -> None:
+        """Begin recording per-call allocation peaks."""
+        tracemalloc.start()
+        sys.settrace(self._trace)
+        threading.settrace(self._trace)
+
+    def stop_allocations(self) -> None:
+        """Stop recording per-call allocation peaks."""
+        threading.settrace(None)  # type: ignore[arg-type]
+        sys.settrace(None)
+        self._frames.clear()
+        tracemalloc.stop()
+
+    def run(self, func: Callable[[], Any]) -> Any:
+        """Call func under the profiler, then again for allocations."""
+        self.start()
+        try:
+            result = func()
+        finally:
+            self.stop()
+        if self.track_allocations:
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.start_allocations()
+                try:
+                    func()
+                finally:
+                    self.stop_allocations()
+        return result
+
+    def write_report(self) -> Tuple[str, str]:
+        """Write the sorted text report and the collapsed-stack file."""
+        report_path = f"{self.prefix}.txt"
+        stacks_path = f"{self.prefix}.collapsed"
+
+        out = io.StringIO()
+        out.write("=== cProfile (sorted by cumulative time) ===\n")
+        stats = pstats.Stats(self.profile, stream=out)
+        stats.sort_stats("cumulative").print_stats(40)
+
+        out.write("=== Peak allocations per call ===\n")
+        if not self.track_allocations:
+            out.write("(not recorded; use --profile-memory)\n")
+        else:
+            out.write(f"{'method':<45} {'calls':>8} {'max KiB':>10} "
+                      f"{'avg KiB':>10}\n")
+        ranked = sorted(
+            self.allocations.items(), key=lambda item: item[1][1],
+            reverse=True
+        )
+        for name, (calls, highest, total) in ranked:
+            out.write(f"{name:<45} {calls:>8} {highest / 1024:>10.1f} "
+                      f"{total / calls / 1024:>10.1f}\n")
+
+        out.write(f"\n=== Hottest sampled stacks "
+                  f"({sum(self.samples.values())} samples) ===\n")
+        for stack, count in self.samples.most_common(15):
+            out.write(f"{count:>6}  {stack.split(';')[-1]}\n")
+
+        with open(report_path, 'w') as f:
+            f.write(out.getvalue())
+        with open(stacks_path, 'w') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        return report_path, stacks_path
+
+
+class ResultCache:
+    """Persists suite results keyed by the content hash of the files tested.
+
+    A suite is only re-run when its exercise file or this test suite has
+    changed since the cached run.
+    """
+
+    def __init__(self, path: str = CACHE_FILE) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, suite: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for suite if it matches key."""
+        entry = self.entries.get(suite)
+        if entry is not None and entry.get("key") == key:
+            return entry
+        return None
+
+    def put(self, suite: str, key: str, result: TestResult,
+            output: str) -> None:
+        """Store a suite result and its captured output."""
+        self.entries[suite] = {
+            "key": key, "result": result.to_dict(), "output": output
+        }
+
+    def save(self) -> None:
+        """Write the cache back to disk."""
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.entries, f)
+        except OSError:
+            pass
+
+
+class FileAnalysis:
+    """Facts collected about one source file in a single AST pass."""
+
+    def __init__(self) -> None:
+        self.has_typing_imports: bool = False
+        # class name -> base class expressions
+        self.classes: Dict[str, List[str]] = {}
+        self.function_count: int = 0
+        self.typed_functions: int = 0
+        self.param_count: int = 0
+        self.typed_params: int = 0
+        self.missing_params: List[Tuple[str, str]] = []
+        self.error: Optional[str] = None
+
+
+class AnalysisVisitor(ast.NodeVisitor):
+    """Collects typing imports, classes and signature annotations in one walk."""
+
+    def __init__(self) -> None:
+        self.analysis = FileAnalysis()
+        self._class_depth = 0
+
+    def visit_Import(self, node: ast.Import) -> None:
+        """Note whether typing is imported."""
+        for alias in node.names:
+            if alias.name == "typing":
+                self.analysis.has_typing_imports = True
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        """Note whether anything is imported from typing."""
+        if node.module == "typing":
+            self.analysis.has_typing_imports = True
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Record the class and its bases, then visit its body."""
+        self.analysis.classes[node.name] = [
+            ast.unparse(base) for base in node.bases
+        ]
+        self._class_depth += 1
+        self.generic_visit(node)
+        self._class_depth -= 1
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Record a function signature."""
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Record an async function signature."""
+        self._visit_function(node)
+
+    def _visit_function(self, node: Any) -> None:
+        """Count return and parameter annotations of any function."""
+        analysis = self.analysis
+        analysis.function_count += 1
+        if node.returns is not None:
+            analysis.typed_functions += 1
+
+        args = node.args
+        positional = args.posonlyargs + args.args
+        params = [(arg, arg.arg) for arg in positional]
+        if args.vararg is not None:
+            params.append((args.vararg, f"*{args.vararg.arg}"))
+        params.extend((arg, arg.arg) for arg in args.kwonlyargs)
+        if args.kwarg is not None:
+            params.append((args.kwarg, f"**{args.kwarg.arg}"))
+
+        for index, (arg, label) in enumerate(params):
+            if arg.arg == "self" or (
+                index == 0 and self._class_depth and arg.arg == "cls"
+            ):
+                continue
+            analysis.param_count += 1
+            if arg.annotation is None:
+                analysis.missing_params.append((node.name, label))
+            else:
+                analysis.typed_params += 1
+
+        # Nested functions are not methods, even inside a class body
+        depth, self._class_depth = self._class_depth, 0
+        self.generic_visit(node)
+        self._class_depth = depth
+
 
 class TypeChecker:
     """Validates type annotations in Python code."""
@@ -70,85 +1026,215 @@ class TypeChecker:
         self.required_imports = [
             "typing", "Any", "List", "Dict", "Union", "Optional"
         ]
+        # path -> (mtime_ns, size, content hash)
+        self._stat_cache: Dict[str, Tuple[int, int, str]] = {}
+        self._analysis_cache: Dict[str, FileAnalysis] = {}
+
+    def _file_key(self, file_path: str) -> str:
+        """Return the content hash of a file, skipping reads when unmodified."""
+        stat = Path(file_path).stat()
+        cached = self._stat_cache.get(file_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        digest = file_digest(file_path)
+        self._stat_cache[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def analyze_file(self, file_path: str) -> FileAnalysis:
+        """Analyze a file, reusing the previous analysis if unchanged."""
+        digest = self._file_key(file_path)
+        analysis = self._analysis_cache.get(digest)
+        if analysis is None:
+            analysis = analyze_source(file_path)
+            self._analysis_cache[digest] = analysis
+        return analysis
+
+    def find_issues(self, analysis: FileAnalysis) -> List[str]:
+        """Turn an analysis into the list of typing issues."""
+        if analysis.error is not None:
+            return [f"Error checking types: {analysis.error}"]
+        issues = []
+        if not analysis.has_typing_imports:
+            issues.append("Missing typing imports")
+
+        for function, param in analysis.missing_params:
+            issues.append(
+                f"Function '{function}' parameter "
+                f"'{param}' missing type annotation"
+            )
+
+        if analysis.function_count > 0:
+            typing_coverage = (
+                analysis.typed_functions / analysis.function_count
+            ) * 100
+            if typing_coverage < 80:
+                issues.append(
+                    f"Low typing coverage: {typing_coverage:.1f}% of "
+                    f"functions have return type annotations"
+                )
+        return issues
+
+    @staticmethod
+    def coverage(analysis: FileAnalysis) -> Tuple[float, float]:
+        """Percent of parameters and of return types that are annotated."""
+        params = 100.0
+        if analysis.param_count:
+            params = 100 * analysis.typed_params / analysis.param_count
+        returns = 100.0
+        if analysis.function_count:
+            returns = 100 * analysis.typed_functions / analysis.function_count
+        return params, returns
+
+    def check_bases(self, file_path: str,
+                    expected: Dict[str, str]) -> List[str]:
+        """Check from source that each class derives from its expected base.
+
+        Bases are followed through the classes defined in the file. A class
+        whose ancestry leads outside the file (an import, ``abc.ABC``) can't
+        be judged from source and is left to the runtime ``issubclass`` check.
+        """
+        classes = self.analyze_file(file_path).classes
+        return [
+            f"{name} must inherit from {base}"
+            for name, base in expected.items()
+            if self._derives(classes, name, base) is False
+        ]
+
+    @staticmethod
+    def _derives(classes: Dict[str, List[str]], name: str,
+                 base: str) -> Optional[bool]:
+        """Whether ``name`` reaches ``base`` in ``classes``; None if unknown."""
+        if name not in classes:
+            return None
+        known = True
+        pending, seen = [name], {name}
+        while pending:
+            for parent in classes[pending.pop()]:
+                if parent == base:
+                    return True
+                if parent not in classes:
+                    known = False
+                elif parent not in seen:
+                    seen.add(parent)
+                    pending.append(parent)
+        return False if known else None
 
     def check_file_typing(self, file_path: str) -> Tuple[bool, List[str]]:
         """Check if file has proper type annotations."""
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            tree = ast.parse(content)
-            issues = []
-            has_typing_imports = False
-
-            # Check for typing imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom) and node.module == "typing":
-                    has_typing_imports = True
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "typing":
-                            has_typing_imports = True
-
-            if not has_typing_imports:
-                issues.append("Missing typing imports")
-
-            # Check function definitions for type annotations
-            function_count = 0
-            typed_functions = 0
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    function_count += 1
-
-                    # Check return type annotation
-                    if node.returns is not None:
-                        typed_functions += 1
-
-                    # Check parameter type annotations
-                    for arg in node.args.args:
-                        if arg.annotation is None and arg.arg != "self":
-                            issues.append(
-                                f"Function '{node.name}' parameter "
-                                f"'{arg.arg}' missing type annotation"
-                            )
-
-            if function_count > 0:
-                typing_coverage = (typed_functions / function_count) * 100
-                if typing_coverage < 80:
-                    issues.append(
-                        f"Low typing coverage: {typing_coverage:.1f}% of "
-                        f"functions have return type annotations"
-                    )
-
+            issues = self.find_issues(self.analyze_file(file_path))
             return len(issues) == 0, issues
-
         except Exception as e:
             return False, [f"Error checking types: {str(e)}"]
 
+    def check_directory(
+        self, root: str, workers: Optional[int] = None
+    ) -> Dict[str, Tuple[bool, List[str]]]:
+        """Check every Python file under root, analyzing changed files in parallel."""
+        base = Path(root)
+        paths = sorted(
+            str(path) for path in base.rglob("*.py")
+            if not any(part.startswith(".") or part == "__pycache__"
+                       for part in path.relative_to(base).parts)
+        )
+        keys = {path: self._file_key(path) for path in paths}
+        stale = [
+            path for path in paths if keys[path] not in self._analysis_cache
+        ]
+        if len(stale) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for path, analysis in zip(
+                    stale, pool.map(analyze_source, stale, chunksize=8)
+                ):
+                    self._analysis_cache[keys[path]] = analysis
+        else:
+            for path in stale:
+                self._analysis_cache[keys[path]] = analyze_source(path)
+
+        report = {}
+        for path in paths:
+            issues = self.find_issues(self._analysis_cache[keys[path]])
+            report[path] = (len(issues) == 0, issues)
+        return report
+
+
+def analyze_source(file_path: str) -> FileAnalysis:
+    """Parse a file and run the analysis visitor over it."""
+    visitor = AnalysisVisitor()
+    try:
+        with open(file_path, 'rb') as f:
+            visitor.visit(ast.parse(f.read()))
+    except (SyntaxError, ValueError, OSError) as e:
+        visitor.analysis.error = str(e)
+    return visitor.analysis
+
 
 class PolymorphismTester:
     """Main testing class for polymorphic implementations with type checking."""
 
+    # (suite method, exercise file it checks)
+    SUITES: List[Tuple[str, str]] = [
+        ("_test_exercise_0", "ex0/stream_processor.py"),
+        ("_test_exercise_1", "ex1/data_stream.py"),
+        ("_test_exercise_2", "ex2/nexus_pipeline.py"),
+    ]
+
+    # Loaded modules keyed by (module name, content hash)
+    _module_cache: Dict[Tuple[str, str], Any] = {}
+
     def __init__(self) -> None:
         self.results: List[TestResult] = []
+        self.perf_results: List[PerfResult] = []
         self.type_checker = TypeChecker()
 
     def load_module(self, file_path: str, module_name: str) -> Optional[Any]:
         """Dynamically load a Python module from file path."""
         try:
+            key = (module_name, file_digest(file_path))
+            if key in self._module_cache:
+                return self._module_cache[key]
+
             spec = importlib.util.spec_from_file_location(module_name, file_path)
             if spec is None or spec.loader is None:
                 return None
 
             module = importlib.util.module_from_spec(spec)
+            # Registered so worker processes can pickle its functions, and
+            # importable by name so spawned workers can load it themselves
+            sys.modules[module_name] = module
+            directory = str(Path(file_path).resolve().parent)
+            if directory not in sys.path:
+                sys.path.append(directory)
             spec.loader.exec_module(module)
+            self._module_cache[key] = module
             return module
         except Exception as e:
+            sys.modules.pop(module_name, None)
             print(f"Error loading module {module_name}: {e}")
             return None
 
-    def run_all_tests(self, verbose: bool = False) -> bool:
+    def run_suite(self, suite: str) -> Tuple[TestResult, str]:
+        """Run one exercise suite, capturing everything it prints."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            getattr(self, suite)()
+        return self.results.pop(), output.getvalue()
+
+    def run_perf_tests(self) -> None:
+        """Run the performance tier over each exercise's classes."""
+        print("\n=== Performance Tier ===")
+        print(f"Input sizes: {', '.join(map(str, PERF_SIZES))}")
+        modules = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _, path in self.SUITES:
+                name = Path(path).stem
+                module = self.load_module(path, name)
+                if module is not None:
+                    modules[name] = module
+        self.perf_results = PerfTester().run(modules)
+
+    def run_all_tests(self, verbose: bool = False, parallel: bool = False,
+                      use_cache: bool = True, perf: bool = False) -> bool:
         """Execute all test suites and return overall success status."""
         print("CODE NEXUS - POLYMORPHISM TESTING SUITE WITH TYPE CHECKING")
         print("=" * 60)
@@ -157,15 +1243,58 @@ class PolymorphismTester:
             print("Verbose mode enabled - detailed output will be shown.")
         print()
 
-        # Run individual test suites
-        self._test_exercise_0()
-        self._test_exercise_1()
-        self._test_exercise_2()
+        cache = ResultCache() if use_cache else None
+        suite_digest = file_digest(__file__)
+        keys = {
+            suite: file_digest(path) + suite_digest
+            for suite, path in self.SUITES
+        }
+
+        # Reuse cached results for unchanged files, run the rest
+        outcomes: Dict[str, Tuple[TestResult, str]] = {}
+        pending = []
+        for suite, _ in self.SUITES:
+            entry = cache.get(suite, keys[suite]) if cache else None
+            if entry is not None:
+                outcomes[suite] = (
+                    TestResult.from_dict(entry["result"]), entry["output"]
+                )
+            else:
+                pending.append(suite)
+
+        if parallel and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=len(pending)) as pool:
+                for suite, (data, output) in zip(
+                    pending, pool.map(_run_suite_worker, pending)
+                ):
+                    outcomes[suite] = (TestResult.from_dict(data), output)
+        else:
+            for suite in pending:
+                outcomes[suite] = self.run_suite(suite)
+
+        for index, (suite, _) in enumerate(self.SUITES):
+            result, output = outcomes[suite]
+            if index > 0 and not output.startswith("\n"):
+                print()
+            print(output, end="")
+            if suite not in pending:
+                print("(cached result - file unchanged)")
+            if cache is not None:
+                cache.put(suite, keys[suite], result, output)
+            self.results.append(result)
+
+        if cache is not None:
+            cache.save()
+
+        if perf:
+            self.run_perf_tests()
 
         # Display summary
         self._display_summary()
 
-        return all(result.passed for result in self.results)
+        return all(result.passed for result in self.results) and all(
+            result.passed for result in self.perf_results
+        )
 
     def _test_exercise_0(self) -> None:
         """Test Exercise 0: Data Processor Foundation with type checking."""
@@ -212,18 +1341,20 @@ class PolymorphismTester:
                     TextProcessor = getattr(stream_processor, 'TextProcessor')
                     LogProcessor = getattr(stream_processor, 'LogProcessor')
 
-                    if not issubclass(NumericProcessor, DataProcessor):
-                        result.add_error(
-                            "NumericProcessor must inherit from DataProcessor"
-                        )
-                    if not issubclass(TextProcessor, DataProcessor):
-                        result.add_error(
-                            "TextProcessor must inherit from DataProcessor"
-                        )
-                    if not issubclass(LogProcessor, DataProcessor):
-                        result.add_error(
-                            "LogProcessor must inherit from DataProcessor"
-                        )
+                    processor_classes = [
+                        NumericProcessor, TextProcessor, LogProcessor
+                    ]
+                    for issue in self.type_checker.check_bases(file_path, {
+                        cls.__name__: "DataProcessor" for cls in processor_classes
+                    }):
+                        result.add_error(issue)
+                    # What the source can't settle is checked at runtime
+                    for processor_class in processor_classes:
+                        issue = (f"{processor_class.__name__} must inherit "
+                                 f"from DataProcessor")
+                        if not issubclass(processor_class, DataProcessor) and \
+                           issue not in result.errors:
+                            result.add_error(issue)
 
                     if not result.errors:
                         print("✓ Inheritance relationships verified")
@@ -247,7 +1378,11 @@ class PolymorphismTester:
 
                             if not result.errors:
                                 print("✓ Method overriding implemented correctly")
-                                if has_proper_typing:
+                                self._run_checks(
+                                    result,
+                                    self._processor_checks(stream_processor),
+                                )
+                                if has_proper_typing and not result.errors:
                                     result.mark_passed()
 
                         except Exception as e:
@@ -310,12 +1445,17 @@ class PolymorphismTester:
                     stream_classes = [
                         SensorStream, TransactionStream, EventStream
                     ]
+                    for issue in self.type_checker.check_bases(file_path, {
+                        cls.__name__: "DataStream" for cls in stream_classes
+                    }):
+                        result.add_error(issue)
+                    # What the source can't settle is checked at runtime
                     for stream_class in stream_classes:
-                        if not issubclass(stream_class, DataStream):
-                            result.add_error(
-                                f"{stream_class.__name__} must inherit "
-                                f"from DataStream"
-                            )
+                        issue = (f"{stream_class.__name__} must inherit "
+                                 f"from DataStream")
+                        if not issubclass(stream_class, DataStream) and \
+                           issue not in result.errors:
+                            result.add_error(issue)
 
                     if not result.errors:
                         print("✓ Inheritance relationships verified")
@@ -338,7 +1478,10 @@ class PolymorphismTester:
 
                             if not result.errors:
                                 print("✓ Polymorphic behavior implemented correctly")
-                                if has_proper_typing:
+                                self._run_checks(
+                                    result, self._stream_checks(data_stream)
+                                )
+                                if has_proper_typing and not result.errors:
                                     result.mark_passed()
 
                         except Exception as e:
@@ -352,6 +1495,575 @@ class PolymorphismTester:
 
         self.results.append(result)
 
+    def _run_checks(self, result: TestResult,
+                    checks: List[Tuple[str, Callable[[], Optional[str]]]]
+                    ) -> None:
+        """Run behavioural checks; each returns None or a failure message."""
+        for label, check in checks:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    failure = check()
+            except Exception as e:
+                failure = f"raised {type(e).__name__}: {e}"
+            if failure is None:
+                print(f"✓ {label}")
+            else:
+                result.add_error(f"{label}: {failure}")
+
+    def _processor_checks(self, stream_processor: Any
+                          ) -> List[Tuple[str, Callable[[], Optional[str]]]]:
+        """Behavioural checks for the optional Exercise 0 features."""
+        checks: List[Tuple[str, Callable[[], Optional[str]]]] = []
+        samples = ["a  b\t\nc", "  lead and trail  ", "one", "", "x\n\ny z "]
+
+        def word_counting() -> Optional[str]:
+            """Runs of mixed whitespace separate words exactly once."""
+            output = stream_processor.TextProcessor().process("a  b\t\nc")
+            if "3 words" not in output:
+                return f"'a  b\\t\\nc' gave {output!r}"
+            return None
+        checks.append(("Text word counting", word_counting))
+
+        if hasattr(stream_processor, "count_words"):
+            def chunked() -> Optional[str]:
+                """Slice boundaries never split or merge words."""
+                for text in samples:
+                    for size in range(1, 8):
+                        words = stream_processor.count_words(text, size)
+                        if words != len(text.split()):
+                            return f"{text!r} in slices of {size}: {words}"
+                        listed = list(stream_processor.iter_words(text, size))
+                        if listed != text.split():
+                            return f"{text!r} in slices of {size}: {listed}"
+                return None
+            checks.append(("Chunked word counting", chunked))
+
+        if hasattr(stream_processor.TextProcessor, "process_corpus"):
+            def corpus() -> Optional[str]:
+                """Totals and terms match a plain scan of the documents."""
+                documents = ["Hello world", "hello  again\nworld", ""] * 50
+                totals = stream_processor.TextProcessor().process_corpus(
+                    documents, workers=1, chunk_docs=7, term_frequencies=True
+                )
+                expected = (len(documents),
+                            sum(len(doc) for doc in documents),
+                            sum(len(doc.split()) for doc in documents))
+                got = (totals["documents"], totals["chars"], totals["words"])
+                if got != expected:
+                    return f"expected {expected}, got {got}"
+                terms = dict(totals["terms"])
+                if terms != {"hello": 100, "world": 100, "again": 50}:
+                    return f"unexpected terms {terms}"
+                return None
+            checks.append(("Corpus totals and terms", corpus))
+
+        if hasattr(stream_processor, "ProcessorRegistry"):
+            def registry() -> Optional[str]:
+                """Inputs reach the processor their type and shape call for."""
+                reg = stream_processor.ProcessorRegistry.with_processors(
+                    stream_processor.NumericProcessor(),
+                    stream_processor.TextProcessor(),
+                    stream_processor.LogProcessor(),
+                )
+                expected = {
+                    (1, 2, 3): "Processed 3 numeric values",
+                    "ERROR: disk full": "ERROR level detected",
+                    "hello world": "2 words",
+                    (1, "a"): "Cannot Proccessing Data",
+                }
+                for data, marker in expected.items():
+                    output = reg.process(data)
+                    if marker not in output:
+                        return f"{data!r} gave {output!r}"
+                return None
+            checks.append(("Registry dispatch", registry))
+        return checks
+
+    def _stream_checks(self, data_stream: Any
+                       ) -> List[Tuple[str, Callable[[], Optional[str]]]]:
+        """Behavioural checks for the optional Exercise 1 features."""
+        checks: List[Tuple[str, Callable[[], Optional[str]]]] = []
+
+        if hasattr(data_stream, "encode_batch"):
+            def round_trip() -> Optional[str]:
+                """Encoded batches decode to the records that went in."""
+                stream = data_stream.SensorStream("RT")
+                batch = [{"type": "temp", "value": 21.5},
+                         {"type": "humidity", "value": 40.0}]
+                decoded = list(stream.decode_batch(stream.encode_batch(batch)))
+                if decoded != batch:
+                    return f"decoded {decoded}"
+                events = ["ERROR: a", "INFO: b", "ERROR: a"]
+                decoded = list(data_stream.BatchView(
+                    data_stream.encode_batch(events)
+                ))
+                if decoded != events:
+                    return f"decoded {decoded}"
+                extra = [{"type": "temp", "value": 1.0, "sensor_id": "s1"}]
+                try:
+                    stream.encode_batch(extra)
+                except ValueError:
+                    pass
+                else:
+                    return "extra keys were dropped silently"
+                lossy = list(stream.decode_batch(
+                    stream.encode_batch(extra, strict=False)
+                ))
+                if lossy != [{"type": "temp", "value": 1.0}]:
+                    return f"non-strict encoding gave {lossy}"
+                # Anything that would not decode as it went in is refused
+                for bad in ([1, 2.5, True], ["a", 1], [None]):
+                    try:
+                        data_stream.encode_batch(bad)
+                    except ValueError:
+                        continue
+                    return f"{bad!r} was encoded lossily"
+                try:
+                    stream.encode_batch([{"type": "temp", "value": None}])
+                except ValueError:
+                    return None
+                return "a record without a numeric value was encoded"
+            checks.append(("Batch encode/decode round trip", round_trip))
+
+        if hasattr(data_stream, "Checkpointer"):
+            def resume() -> Optional[str]:
+                """A resumed run ends where an uninterrupted one does."""
+                batches = [[{"action": "sell", "amount": i}] for i in range(1, 11)]
+                processor = data_stream.StreamProcessor()
+                with tempfile.TemporaryDirectory() as directory:
+                    path = os.path.join(directory, "state.ckpt")
+                    first = data_stream.TransactionStream("CK")
+                    # Stop after six batches as if the process had died
+                    processor.process_source(
+                        first, batches[:6],
+                        data_stream.Checkpointer(path, every_batches=2),
+                    )
+                    resumed = data_stream.TransactionStream("CK")
+                    results = processor.process_source(
+                        resumed, batches, data_stream.Checkpointer(path)
+                    )
+                if len(results) != 4:
+                    return f"replayed {len(results)} batches instead of 4"
+                stats = resumed.get_stats()
+                if (stats["total_operations"], stats["current_balance"]) != (10, 55):
+                    return f"resumed stats {stats}"
+                return None
+            checks.append(("Checkpoint resume", resume))
+
+        if hasattr(data_stream, "HyperLogLog"):
+            def distinct() -> Optional[str]:
+                """Estimates stay within tolerance and merge like a union."""
+                left = data_stream.HyperLogLog(precision=10)
+                right = data_stream.HyperLogLog(precision=10)
+                left.update(range(0, 6000))
+                right.update(range(4000, 10000))
+                if abs(left.count() - 6000) > 600:
+                    return f"estimated {left.count()} of 6000"
+                union = left.merge(right).count()
+                if abs(union - 10000) > 1000:
+                    return f"merged estimate {union} of 10000"
+                try:
+                    left.merge(data_stream.HyperLogLog(precision=11))
+                except ValueError:
+                    return None
+                return "merged sketches of different precision"
+            checks.append(("Distinct counting", distinct))
+
+        if hasattr(data_stream, "SensorReading"):
+            def compact() -> Optional[str]:
+                """Compact records behave like their dict form."""
+                reading = data_stream.SensorReading("temp", 21.5)
+                if reading != {"type": "temp", "value": 21.5}:
+                    return "differs from its dict form"
+                same = data_stream.SensorReading("temp", 21.5)
+                if hash(reading) != hash(same) or len({reading, same}) != 1:
+                    return "equal records hash differently"
+                if reading == data_stream.Transaction("temp", 21.5):
+                    return "records of different types compare equal"
+                compact_out = data_stream.SensorStream("C").process_batch(
+                    [reading, data_stream.SensorReading("temp", 23.5)]
+                )
+                dict_out = data_stream.SensorStream("D").process_batch(
+                    [{"type": "temp", "value": 21.5},
+                     {"type": "temp", "value": 23.5}]
+                )
+                if compact_out != dict_out:
+                    return f"{compact_out!r} != {dict_out!r}"
+                # Codes differ between processes; pickles must carry symbols
+                shipped = data_stream.Transaction("refund-check", 7)
+                payload = pickle.dumps(shipped)
+                if b"refund-check" not in payload:
+                    return "pickled records carry process-local codes"
+                if pickle.loads(payload) != shipped:
+                    return "records don't survive a pickle round trip"
+                return None
+            checks.append(("Compact records", compact))
+
+        if hasattr(data_stream.DataStream, "enable_dedup"):
+            def dedup() -> Optional[str]:
+                """Replayed records don't change the running totals."""
+                stream = data_stream.TransactionStream("DD")
+                stream.enable_dedup(fields=("id",))
+                for ids in ((1, 2, 3), (2, 3, 4)):
+                    stream.process_batch([
+                        {"id": i, "action": "sell", "amount": 10} for i in ids
+                    ])
+                stats = stream.get_stats()
+                if (stats["total_operations"], stats["current_balance"]) != (4, 40):
+                    return f"stats after a replay {stats}"
+                return None
+            checks.append(("Duplicate suppression", dedup))
+
+        if hasattr(data_stream, "SharedMemoryExecutor"):
+            def shared() -> Optional[str]:
+                """Worker aggregates over pooled blocks match a plain scan."""
+                rng = random.Random(7)
+                batches = [
+                    [{"type": rng.choice(("temp", "humidity")),
+                      "value": round(rng.uniform(-5.0, 40.0), 2)}
+                     for _ in range(rng.randint(50, 300))]
+                    for _ in range(12)
+                ]
+                expected: Dict[str, List[float]] = {}
+                for record in itertools.chain.from_iterable(batches):
+                    value = record["value"]
+                    entry = expected.setdefault(
+                        record["type"], [0, 0.0, value, value]
+                    )
+                    entry[0] += 1
+                    entry[1] += value
+                    entry[2] = min(entry[2], value)
+                    entry[3] = max(entry[3], value)
+                stream = data_stream.SensorStream("SHM")
+                with data_stream.SharedMemoryExecutor(
+                    workers=2, max_in_flight=2
+                ) as executor:
+                    got = stream.aggregate_shared(batches, executor)
+                    reused = executor.pool.reused
+                if got.keys() != expected.keys():
+                    return f"keys {sorted(got)}"
+                for key, (count, total, low, high) in expected.items():
+                    g_count, g_total, g_low, g_high = got[key]
+                    if (g_count, g_low, g_high) != (count, low, high) or \
+                       not math.isclose(g_total, total):
+                        return f"{key}: {got[key]} instead of {expected[key]}"
+                if not reused:
+                    return "no shared block was reused"
+                return None
+            checks.append(("Shared-memory aggregation", shared))
+
+        if hasattr(data_stream, "write_batch_display"):
+            def display() -> Optional[str]:
+                """Previews agree for sequences and iterators alike."""
+                show = data_stream.format_batch_for_display
+                if show("other", (1, 2)) != "Processing batch: (1, 2)":
+                    return f"tuple shown as {show('other', (1, 2))!r}"
+                records = [{"type": "temp", "value": i} for i in range(10)]
+                batch = records[:1] + ["junk"] + records[1:]
+                expected = {
+                    (2, 1): "[temp:0, temp:1, ... 7 more, temp:9]",
+                    (0, 0): "[... 11 more]",
+                    (1, 20): "[temp:0, ... 1 more, temp:1, temp:2, temp:3, "
+                             "temp:4, temp:5, temp:6, temp:7, temp:8, temp:9]",
+                }
+                for (head, tail), shown in expected.items():
+                    lazy = io.StringIO()
+                    data_stream.write_batch_display(
+                        "sensor", iter(batch), lazy.write, head, tail
+                    )
+                    for output in (show("sensor", batch, head, tail),
+                                   lazy.getvalue().rstrip("\n")):
+                        if output != f"Processing sensor batch: {shown}":
+                            return f"head={head}, tail={tail}: {output!r}"
+                return None
+            checks.append(("Batch display previews", display))
+
+        if hasattr(data_stream, "StreamScheduler"):
+            def scheduler() -> Optional[str]:
+                """Threaded producers against the scheduler's bounded queues."""
+                sched = data_stream.StreamScheduler(target_latency=0.001)
+                sched.register("sensor", data_stream.SensorStream("S"),
+                               capacity=200)
+                sched.register("trans", data_stream.TransactionStream("T"),
+                               capacity=200)
+                per_producer = 2000
+                makers: Dict[str, Callable[[int], Any]] = {
+                    "sensor": lambda i: {"type": "temp", "value": i % 10},
+                    # One malformed record must not sink the rest
+                    "trans": lambda i: {"action": "buy"} if i == 500
+                    else {"action": "sell", "amount": 1},
+                }
+
+                def produce(name: str) -> None:
+                    """Offer every item, backing off while the queue is full."""
+                    for i in range(per_producer):
+                        while not sched.offer(name, makers[name](i)):
+                            time.sleep(0.0005)
+
+                # Daemons, so a failing check can't leave producers blocked
+                threads = [threading.Thread(target=produce, args=(name,),
+                                            daemon=True)
+                           for name in makers]
+                for thread in threads:
+                    thread.start()
+                while any(thread.is_alive() for thread in threads):
+                    if not sched.run_once():
+                        time.sleep(0.0005)
+                for thread in threads:
+                    thread.join()
+                sched.run_until_idle()
+
+                metrics = sched.get_metrics()
+                for name, lane in metrics.items():
+                    handled = lane["processed"] + lane["failed"]
+                    if handled != per_producer:
+                        return f"{name} handled {handled} of {per_producer}"
+                if metrics["trans"]["errors"] != 1:
+                    return f"expected 1 failed batch, got {metrics['trans']}"
+                if metrics["sensor"]["failed"]:
+                    return "a healthy stream reported failures"
+                return None
+            checks.append(("Scheduler serves threaded producers", scheduler))
+        return checks
+
+    def _pipeline_checks(self, nexus_pipeline: Any
+                         ) -> List[Tuple[str, Callable[[], Optional[str]]]]:
+        """Behavioural checks for the optional Exercise 2 features."""
+        checks: List[Tuple[str, Callable[[], Optional[str]]]] = []
+
+        if hasattr(nexus_pipeline, "DedupStage"):
+            def dedup() -> Optional[str]:
+                """Duplicates are dropped and counted, never returned."""
+                pipe = nexus_pipeline.StagePipeline("DEDUP", [
+                    nexus_pipeline.DedupStage(fields=("id",), verbose=False)
+                ])
+                if pipe.process({"id": 1}) != {"id": 1}:
+                    return "first record was not passed through"
+                if pipe.process({"id": 1}) is not None:
+                    return "process() returned a dropped record"
+                results = pipe.process_batch([{"id": 1}, {"id": 2}, {"id": 2}])
+                if results != [{"id": 2}] or pipe.get_stats()["dropped"] != 2:
+                    return f"batch gave {results}, stats {pipe.get_stats()}"
+                # A retried record must not be mistaken for its own duplicate
+                poison = nexus_pipeline.StagePipeline("RETRY", [
+                    nexus_pipeline.DedupStage(verbose=False),
+                    nexus_pipeline.TransformStage(False),
+                ])
+                poison.process_batch(["INVALID_DATA"], retries=2, backoff=0.0)
+                stats = poison.get_stats()
+                if (stats["failed"], stats["dropped"], stats["retried"]) != (1, 0, 2):
+                    return f"retried poison record: {stats}"
+                if poison.dead_letters[0].stage != "TransformStage":
+                    return f"dead letter {poison.dead_letters[0]!r}"
+                return None
+            checks.append(("Duplicate suppression", dedup))
+
+        def routing() -> Optional[str]:
+            """Each record shape reaches the matching adapter."""
+            manager = nexus_pipeline.NexusManager()
+            if manager.process_data({"sensor": "temp", "value": 1}) is not None:
+                return "an empty manager produced output"
+            for adapter in (nexus_pipeline.JSONAdapter,
+                            nexus_pipeline.CSVAdapter,
+                            nexus_pipeline.StreamAdapter):
+                manager.add_pipeline(adapter(adapter.__name__, verbose=False))
+            expected = [
+                ({"sensor": "temp", "value": 22.5}, "temperature reading: 22.5"),
+                ("user,login,1", "User activity logged"),
+                ([20.0, 22.0, 24.0], "3 readings, avg: 22.0"),
+            ]
+            for data, marker in expected:
+                output = manager.process_data(data)
+                if marker not in str(output):
+                    return f"{data!r} gave {output!r}"
+            return None
+        checks.append(("Manager routing", routing))
+
+        if hasattr(nexus_pipeline, "StreamAggregator"):
+            def aggregation() -> Optional[str]:
+                """Summaries reflect every reading and are emitted on count."""
+                summaries: List[Dict[str, Any]] = []
+                aggregator = nexus_pipeline.StreamAggregator(
+                    emit_every=2, emit_interval=3600.0,
+                    on_summary=summaries.append,
+                )
+                adapter = nexus_pipeline.StreamAdapter(
+                    "AGG", aggregator, verbose=False
+                )
+                adapter.process([3.0, 1.0])
+                output = adapter.process([5.0, 7.0])
+                summary = aggregator.summary()
+                got = (summary["count"], summary["avg"],
+                       summary["min"], summary["max"])
+                if got != (4, 4.0, 1.0, 7.0):
+                    return f"summary {summary}"
+                if "4 readings, avg: 4.0" not in output:
+                    return f"output {output!r}"
+                if [s["count"] for s in summaries] != [2, 4]:
+                    return f"emitted {summaries}"
+                # Digits inside identifiers are not readings
+                text = nexus_pipeline.StreamAggregator()
+                for line in ("SENSOR_001 temp=22.5", "user-7 reading 1e3"):
+                    text.feed(line)
+                if (text.count, text.total) != (2, 1022.5):
+                    return f"parsed {text.summary()} from text readings"
+                return None
+            checks.append(("Stream aggregation", aggregation))
+
+        if hasattr(nexus_pipeline, "DeadLetter"):
+            def isolation() -> Optional[str]:
+                """Bad records are dead-lettered where they last failed."""
+                pipe = nexus_pipeline.JSONAdapter("MAIN", verbose=False)
+                results = pipe.process_batch(
+                    [{"sensor": "temp", "value": 1}, {}, "INVALID_DATA"]
+                )
+                if len(results) != 1 or pipe.get_stats()["failed"] != 2:
+                    return f"stats {pipe.get_stats()}"
+                letter = pipe.dead_letters[0]
+                if (letter.pipeline_id, letter.stage) != ("MAIN", "InputStage"):
+                    return f"first dead letter {letter!r}"
+                backup = nexus_pipeline.JSONAdapter("BACKUP", verbose=False)
+                pipe.set_backup(backup)
+                pipe.process_batch([{}])
+                if pipe.dead_letters[-1].pipeline_id != "BACKUP":
+                    return f"backup failure {pipe.dead_letters[-1]!r}"
+                return None
+            checks.append(("Per-record fault isolation", isolation))
+
+        if hasattr(nexus_pipeline, "PipelineChain"):
+            def chaining() -> Optional[str]:
+                """Each link hands structured records to the next."""
+                sink = nexus_pipeline.MemorySink()
+                chain = (
+                    nexus_pipeline.StagePipeline("A", [
+                        nexus_pipeline.InputStage(False),
+                        nexus_pipeline.TransformStage(False),
+                    ])
+                    | nexus_pipeline.StagePipeline("B", [
+                        nexus_pipeline.InputStage(False),
+                        nexus_pipeline.AnalyzeStage(verbose=False),
+                    ])
+                    | nexus_pipeline.StagePipeline("C", [sink])
+                )
+                if len(chain.stages) != 4:
+                    return f"{len(chain.stages)} stages instead of 4"
+                records = [{"sensor": "temp", "value": v} for v in (20.0, 24.0)]
+                out = list(chain.stream(records))
+                chain.close()
+                if out[-1].get("status") != "valid" or out[-1].get("running_avg") != 22.0:
+                    return f"chain output {out}"
+                if sink.records != out:
+                    return f"sink stored {sink.records}"
+                # Records the backup rescues still count as handled
+                chain.set_backup(nexus_pipeline.StagePipeline("SPARE", []))
+                chain.process_batch([{"sensor": "temp", "value": 1.0}, {}])
+                if chain.get_stats()["records"] != 4:
+                    return f"chain stats {chain.get_stats()}"
+                return None
+            checks.append(("Pipeline chaining", chaining))
+
+        if hasattr(nexus_pipeline, "BufferedSink"):
+            def sinks() -> Optional[str]:
+                """Each flush threshold fires and close() writes the rest."""
+                records = [{"id": i, "value": i * 1.5} for i in range(7)]
+                with tempfile.TemporaryDirectory() as directory:
+                    path = os.path.join(directory, "out")
+                    by_count = nexus_pipeline.JSONLSink(path + ".jsonl",
+                                                        max_records=3)
+                    by_size = nexus_pipeline.CSVSink(path + ".csv",
+                                                     ["id", "value"],
+                                                     max_bytes=20)
+                    by_time = nexus_pipeline.SQLiteSink(
+                        path + ".db", columns=["id", "value"], max_seconds=0.0
+                    )
+                    for sink in (by_count, by_size, by_time):
+                        for record in records:
+                            sink.process(record)
+                        flushed = sink.flushes
+                        sink.close()
+                        if sink.written != len(records):
+                            return f"{type(sink).__name__} wrote {sink.written}"
+                        if sink is by_size and not 1 < flushed < len(records):
+                            return f"CSVSink flushed {flushed} times by size"
+                    if by_count.flushes != 3 or by_time.flushes != len(records):
+                        return (f"flushes: {by_count.flushes} by count, "
+                                f"{by_time.flushes} by time")
+                    with open(path + ".jsonl", encoding="utf-8") as f:
+                        lines = [json.loads(line) for line in f]
+                    with open(path + ".csv", encoding="utf-8", newline="") as f:
+                        rows = [{"id": int(row["id"]), "value": float(row["value"])}
+                                for row in csv.DictReader(f)]
+                    connection = sqlite3.connect(path + ".db")
+                    try:
+                        query = "SELECT id, value FROM records"
+                        stored = [{"id": i, "value": v}
+                                  for i, v in connection.execute(query)]
+                    finally:
+                        connection.close()
+                for name, got in (("JSONL", lines), ("CSV", rows),
+                                  ("SQLite", stored)):
+                    if got != records:
+                        return f"{name} file holds {got}"
+                return None
+            checks.append(("Buffered sinks", sinks))
+
+        if hasattr(nexus_pipeline, "RotatingBloomFilter"):
+            def bloom_copies() -> Optional[str]:
+                """The dedup filter copied from Exercise 1 behaves the same."""
+                data_stream = self.load_module("ex1/data_stream.py",
+                                               "data_stream")
+                if not hasattr(data_stream, "RotatingBloomFilter"):
+                    return None
+                filters = [module.RotatingBloomFilter(capacity=50, fp_rate=0.01,
+                                                      rotate_seconds=3600.0)
+                           for module in (data_stream, nexus_pipeline)]
+                rng = random.Random(11)
+                records = [{"id": rng.randint(0, 120), "kind": "a"}
+                           for _ in range(400)]
+                keys = [data_stream.record_key(r, ("id",)) for r in records]
+                for fields in (("id",), ("id", "kind"), None):
+                    for record in (records[0], "line", 7):
+                        if data_stream.record_key(record, fields) != \
+                           nexus_pipeline.record_key(record, fields):
+                            return f"record_key differs for {record!r}"
+                added = [[bloom.add(key) for key in keys] for bloom in filters]
+                if added[0] != added[1]:
+                    return "add() results differ"
+                ex1_bloom, ex2_bloom = filters
+                if ex1_bloom.get_stats() != ex2_bloom.get_stats() or \
+                   ex1_bloom.get_state() != ex2_bloom.get_state():
+                    return "stats or state differ after the same keys"
+                # A checkpoint from one copy must load into the other
+                restored = nexus_pipeline.RotatingBloomFilter(
+                    capacity=50, fp_rate=0.01, rotate_seconds=3600.0
+                )
+                restored.set_state(ex1_bloom.get_state())
+                probes = [(i,) for i in range(200)]
+                if [key in restored for key in probes] != \
+                   [key in ex1_bloom for key in probes]:
+                    return "a restored checkpoint answers differently"
+                return None
+            checks.append(("Dedup filter copies agree", bloom_copies))
+
+        if hasattr(nexus_pipeline, "AdaptiveBatcher"):
+            def batching() -> Optional[str]:
+                """Every submitted record comes out of exactly one flush."""
+                batcher = nexus_pipeline.AdaptiveBatcher(
+                    nexus_pipeline.StagePipeline("BATCH", []),
+                    max_batch=8, max_wait=3600.0, min_samples=10,
+                )
+                out: List[Any] = []
+                for i in range(50):
+                    out.extend(batcher.submit(i))
+                out.extend(batcher.flush())
+                if out != list(range(50)):
+                    return f"got {len(out)} records back, out of order or lost"
+                if batcher.get_stats()["records"] != 50:
+                    return f"stats {batcher.get_stats()}"
+                return None
+            checks.append(("Adaptive micro-batching", batching))
+        return checks
+
     def _test_exercise_2(self) -> None:
         """Test Exercise 2: Nexus Integration with type checking."""
         result = TestResult("Exercise 2: Nexus Integration")
@@ -402,12 +2114,18 @@ class PolymorphismTester:
                     adapter_classes = [
                         JSONAdapter, CSVAdapter, StreamAdapter
                     ]
+                    for issue in self.type_checker.check_bases(file_path, {
+                        cls.__name__: "ProcessingPipeline"
+                        for cls in adapter_classes
+                    }):
+                        result.add_error(issue)
+                    # What the source can't settle is checked at runtime
                     for adapter_class in adapter_classes:
-                        if not issubclass(adapter_class, ProcessingPipeline):
-                            result.add_error(
-                                f"{adapter_class.__name__} must inherit "
-                                f"from ProcessingPipeline"
-                            )
+                        issue = (f"{adapter_class.__name__} must inherit "
+                                 f"from ProcessingPipeline")
+                        if not issubclass(adapter_class, ProcessingPipeline) and \
+                           issue not in result.errors:
+                            result.add_error(issue)
 
                     if not result.errors:
                         print("✓ Complex inheritance hierarchy verified")
@@ -432,7 +2150,11 @@ class PolymorphismTester:
 
                             if not result.errors:
                                 print("✓ Enterprise-level polymorphism implemented correctly")
-                                if has_proper_typing:
+                                self._run_checks(
+                                    result,
+                                    self._pipeline_checks(nexus_pipeline),
+                                )
+                                if has_proper_typing and not result.errors:
                                     result.mark_passed()
 
                         except Exception as e:
@@ -473,12 +2195,46 @@ class PolymorphismTester:
                 for error in result.errors:
                     print(f"   • {error}")
 
+        if self.perf_results:
+            perf_passed = sum(1 for r in self.perf_results if r.passed)
+            print(f"\nPerformance checks passed: "
+                  f"{perf_passed}/{len(self.perf_results)}")
+            for result in self.perf_results:
+                mark = "✓" if result.passed else "❌"
+                print(f"   {mark} {result.name}: "
+                      f"{PerfTester.describe(result)}")
+                for flag in result.flags:
+                    print(f"      • {flag}")
+
         print("\nRemember: This tests basic functionality "
               "and type annotations.")
         print("Make sure your code demonstrates proper polymorphic behavior "
               "with complete typing!")
 
 
+def _run_suite_worker(suite: str) -> Tuple[Dict[str, Any], str]:
+    """Run one suite in a worker process and return its result and output."""
+    result, output = PolymorphismTester().run_suite(suite)
+    return result.to_dict(), output
+
+
+def run_typecheck(root: str, parallel: bool) -> bool:
+    """Print an annotation report for every Python file under root."""
+    checker = TypeChecker()
+    print(f"=== Type Check: {root} ===")
+    report = checker.check_directory(root, workers=None if parallel else 1)
+    for path, (passed, issues) in report.items():
+        params, returns = checker.coverage(checker.analyze_file(path))
+        mark = "✓" if passed else "✗"
+        print(f"{mark} {path}: {params:.1f}% of parameters, "
+              f"{returns:.1f}% of returns annotated")
+        for issue in issues:
+            print(f"    • {issue}")
+    passed_count = sum(1 for passed, _ in report.values() if passed)
+    print(f"\nFiles passed: {passed_count}/{len(report)}")
+    return passed_count == len(report)
+
+
 def print_help() -> None:
     """Display help message."""
     help_text = """
@@ -488,8 +2244,23 @@ Usage:
     python3 main.py [OPTIONS]
 
 Options:
-    -h, --help     Show this help message and exit
-    -v, --verbose  Enable verbose output with detailed test information
+    -h, --help      Show this help message and exit
+    -v, --verbose   Enable verbose output with detailed test information
+    -j, --parallel  Run the exercise suites in separate worker processes
+    --no-cache      Ignore and do not update the result cache
+    --perf          Also run the performance tier (scaling and memory checks)
+    --profile [FILE]
+                    Profile the run (or the given exercise script) and write
+                    nexus_profile.txt and nexus_profile.collapsed
+    --profile-memory [FILE]
+                    Like --profile, plus a second pass recording the peak
+                    allocation of each process/process_batch/filter_data call
+    --soak SECONDS  Drive the streams and pipelines with generated load for
+                    SECONDS and report throughput, latency and RSS
+    --typecheck [DIR]
+                    Only check type annotations of every .py file under DIR
+                    (default: current directory), with -j in parallel
+    --seed N        Seed for the --soak workload generator (default 0)
 
 Description:
     This testing suite validates your polymorphic data processing
@@ -518,6 +2289,11 @@ Examples:
     python3 main.py              # Run all tests
     python3 main.py --help       # Show this help message
     python3 main.py --verbose    # Run with detailed output
+    python3 main.py --parallel   # Run exercise suites in parallel
+    python3 main.py --perf       # Add performance-conformance checks
+    python3 main.py --profile ex1/data_stream.py  # Profile one demo
+    python3 main.py --soak 600   # Ten-minute soak test
+    python3 main.py --typecheck ex1  # Annotation report for one directory
 
 For more information, refer to the project subject.
 """
@@ -528,16 +2304,78 @@ def main() -> None:
     """Main entry point for the testing suite."""
     # Parse command line arguments
     verbose = False
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['-h', '--help']:
+    parallel = False
+    use_cache = True
+    perf = False
+    profile = False
+    profile_memory = False
+    target: Optional[str] = None
+    soak: Optional[float] = None
+    seed = 0
+    typecheck = False
+    typecheck_root: Optional[str] = None
+    pending: Optional[str] = None
+    for arg in sys.argv[1:]:
+        if pending is not None:
+            try:
+                if pending == '--soak':
+                    soak = float(arg)
+                else:
+                    seed = int(arg)
+            except ValueError:
+                print(f"{pending} expects a number, got: {arg}")
+                sys.exit(1)
+            pending = None
+        elif arg in ['--soak', '--seed']:
+            pending = arg
+        elif arg in ['-h', '--help']:
             print_help()
             sys.exit(0)
-        elif sys.argv[1] in ['-v', '--verbose']:
+        elif arg in ['-v', '--verbose']:
             verbose = True
+        elif arg in ['-j', '--parallel']:
+            parallel = True
+        elif arg == '--no-cache':
+            use_cache = False
+        elif arg == '--perf':
+            perf = True
+        elif arg == '--profile':
+            profile = True
+        elif arg == '--profile-memory':
+            profile = profile_memory = True
+        elif profile and target is None and arg.endswith('.py'):
+            target = arg
+        elif arg == '--typecheck':
+            typecheck = True
+        elif (typecheck and typecheck_root is None
+              and not arg.startswith('-')):
+            typecheck_root = arg
         else:
-            print(f"Unknown option: {sys.argv[1]}")
+            print(f"Unknown option: {arg}")
             print("Use --help for usage information")
             sys.exit(1)
+    if pending is not None:
+        print(f"{pending} expects a value")
+        sys.exit(1)
+
+    if typecheck:
+        sys.exit(0 if run_typecheck(typecheck_root or ".", parallel) else 1)
+
+    profiler = Profiler(track_allocations=profile_memory) if profile else None
+    if profiler is not None and target is not None:
+        print(f"Profiling {target}...")
+
+        def run_target() -> None:
+            """Run the script, treating sys.exit as a normal finish."""
+            try:
+                runpy.run_path(target, run_name="__main__")
+            except SystemExit:
+                pass
+
+        profiler.run(run_target)
+        report, stacks = profiler.write_report()
+        print(f"\nProfile written to {report} and {stacks}")
+        sys.exit(0)
 
     # Verify exercise directories exist
     ex0_dir = Path("ex0")
@@ -561,7 +2399,30 @@ def main() -> None:
         sys.exit(1)
 
     tester = PolymorphismTester()
-    success = tester.run_all_tests(verbose=verbose)
+    if soak is not None:
+        print(f"=== Soak Test: {soak:g}s, seed {seed} ===")
+        modules = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _, path in tester.SUITES:
+                name = Path(path).stem
+                module = tester.load_module(path, name)
+                if module is not None:
+                    modules[name] = module
+        runner = SoakRunner(modules, soak, WorkloadGenerator(seed=seed))
+        sys.exit(0 if runner.run() else 1)
+
+    if profiler is not None:
+        # Everything has to run in this process, uncached, to be profiled;
+        # a fresh tester per pass keeps the allocation pass's results apart
+        success = profiler.run(lambda: PolymorphismTester().run_all_tests(
+            verbose=verbose, parallel=False, use_cache=False, perf=perf
+        ))
+        report, stacks = profiler.write_report()
+        print(f"\nProfile written to {report} and {stacks}")
+    else:
+        success = tester.run_all_tests(
+            verbose=verbose, parallel=parallel, use_cache=use_cache, perf=perf
+        )
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)